@@ -3,6 +3,6 @@ AI operation module for Big Head Jeopardy game system.
 """
 
 from .player import AIPlayer, GameState
-from .llm_state_manager import LLMStateManager, LLMGameState 
+from .llm_state_manager import LLMStateManager, LLMGameState, get_llm_state_manager
 from .utils.tts import TTSClient
 from .utils.prompt_manager import PromptManager 
\ No newline at end of file
@@ -6,7 +6,7 @@ import logging
 import re
 from typing import Dict, Any, Optional
 
-from ..utils.llm import LLMClient, LLMConfig
+from ..utils.llm import LLMConfig, get_shared_llm_client
 
 logger = logging.getLogger(__name__)
 
@@ -15,7 +15,7 @@ class AnswerEvaluator:
     
     def __init__(self):
         """Initialize the answer evaluator"""
-        self.llm_client = LLMClient()
+        self.llm_client = get_shared_llm_client()
         self.llm_config = LLMConfig(
             temperature=0.3,
             response_format={"type": "json_object"}
@@ -6,19 +6,19 @@ import logging
 import asyncio
 import os
 import time
-from typing import Optional, Deque, Set
+from typing import List, Optional, Deque, Set
 from pathlib import Path
 from collections import deque
 
 from ..utils.tts import TTSClient
-from .utils.helpers import cleanup_audio_files
+from .utils.helpers import cleanup_audio_files_async
 
 logger = logging.getLogger(__name__)
 
 class AudioManager:
     """Manages audio queue and playback for the AI host"""
     
-    def __init__(self, api_key=None, voice="Timothy"):
+    def __init__(self, api_key=None, voice="Timothy", max_concurrent_tts=3):
         """Initialize the audio manager"""
         self.tts_client = TTSClient(api_key=api_key)
         self.tts_voice = voice
@@ -29,6 +29,8 @@ class AudioManager:
         self.incorrect_answer_audio_id = None
         self.recent_audio_files = set()
         self.max_recent_files = 10
+        # Limits concurrent TTS requests to stay within the API rate limits
+        self.tts_semaphore = asyncio.Semaphore(max_concurrent_tts)
         
     def set_game_service(self, game_service):
         """Set the game service reference"""
@@ -45,6 +47,11 @@ class AudioManager:
         """Shut down the audio manager"""
         self.is_playing_audio = False
         logger.info("Audio manager shutting down")
+    
+    async def aclose(self):
+        """Shut down the audio manager and close the TTS client's HTTP session"""
+        self.shutdown()
+        await self.tts_client.aclose()
         
     def is_audio_playing(self) -> bool:
         """Check if any audio is currently playing."""
@@ -123,40 +130,111 @@ class AudioManager:
                 oldest_files = sorted(self.recent_audio_files)[:10]  # Sort by timestamp in filename
                 self.recent_audio_files = self.recent_audio_files - set(oldest_files)
             
-            # Create paths for audio files
-            static_dir = os.path.join("static", "audio")
+            # Synthesize the speech, then queue it for playback
+            audio_path = await self.synthesize(text, filename)
+            if audio_path:
+                await self.enqueue(audio_path)
             
-            # Ensure directories exist
-            os.makedirs(static_dir, exist_ok=True)
+        except Exception as e:
+            logger.error(f"Error synthesizing speech: {e}")
+            import traceback
+            logger.error(traceback.format_exc())
+    
+    async def synthesize(self, text: str, filename: Optional[str] = None) -> Optional[str]:
+        """
+        Synthesize speech from text into the static audio directory.
+        
+        Args:
+            text: The text to convert to speech
+            filename: Optional output filename (a unique one is generated if omitted)
             
-            # Generate speech - use the correct method name from TTSClient
+        Returns:
+            Path to the audio file, or None if synthesis failed
+        """
+        try:
+            filename = filename or f"question_audio_{time.time_ns()}.wav"
+            
+            # Ensure the static audio directory exists
+            static_dir = os.path.join("static", "audio")
+            os.makedirs(static_dir, exist_ok=True)
             output_path = os.path.join(static_dir, filename)
-            result_file = self.tts_client.generate_speech(
-                text=text,
-                voice_name=self.tts_voice,
-                output_file=output_path
-            )
             
-            if os.path.exists(result_file) and os.path.getsize(result_file) > 0:
-                # Add to audio queue instead of playing immediately
-                public_url = f"/static/audio/{filename}"
-                logger.info(f"Adding audio to queue: {public_url}")
-                
-                # Check if this audio file is already in the queue to prevent duplicates
-                if public_url not in self.audio_queue:
-                    self.audio_queue.append(public_url)
-                else:
-                    logger.warning(f"Skipping duplicate audio in queue: {public_url}")
-                
-                # Clean up old audio files
-                await cleanup_audio_files(static_dir, 5)
-            else:
-                logger.error(f"Failed to create valid audio file at: {result_file}")
+            async with self.tts_semaphore:
+                result_file = await self.tts_client.generate_speech(
+                    text=text,
+                    voice_name=self.tts_voice,
+                    output_file=output_path
+                )
+            
+            if result_file and os.path.exists(result_file) and os.path.getsize(result_file) > 0:
+                return result_file
+            
+            logger.error(f"Failed to create valid audio file at: {result_file}")
+            return None
             
         except Exception as e:
             logger.error(f"Error synthesizing speech: {e}")
             import traceback
             logger.error(traceback.format_exc())
+            return None
+    
+    async def enqueue(self, audio_path: str, cleanup: bool = True):
+        """
+        Add a synthesized audio file to the playback queue.
+        
+        Args:
+            audio_path: Path to the audio file in the static audio directory
+            cleanup: Whether to delete old audio files afterwards
+        """
+        public_url = f"/static/audio/{os.path.basename(audio_path)}"
+        logger.info(f"Adding audio to queue: {public_url}")
+        
+        # Check if this audio file is already in the queue to prevent duplicates
+        if public_url not in self.audio_queue:
+            self.audio_queue.append(public_url)
+        else:
+            logger.warning(f"Skipping duplicate audio in queue: {public_url}")
+        
+        # Clean up old audio files
+        if cleanup:
+            await cleanup_audio_files_async(os.path.dirname(audio_path), 5)
+    
+    def prefetch_speech(self, texts: List[str]):
+        """
+        Start synthesizing likely upcoming utterances in the background.
+        
+        A later synthesize call for the same text is served from the TTS cache
+        instead of waiting on the API.
+        
+        Args:
+            texts: The texts that may be spoken next
+        """
+        for text in texts:
+            self.tts_client.prefetch(text, self.tts_voice)
+    
+    async def say_all(self, texts: List[str]):
+        """
+        Synthesize several utterances concurrently and queue them in order.
+        
+        The TTS requests overlap each other (bounded by the TTS semaphore), so
+        later utterances are ready by the time earlier ones finish playing.
+        
+        Args:
+            texts: The texts to speak, in playback order
+        """
+        if not texts:
+            return
+        
+        audio_paths = await asyncio.gather(*(self.synthesize(text) for text in texts))
+        
+        # Queue in the original order, skipping any that failed to synthesize
+        queued = [path for path in audio_paths if path]
+        for audio_path in queued:
+            await self.enqueue(audio_path, cleanup=False)
+        
+        # Keep at least everything just queued so nothing is deleted before it plays
+        if queued:
+            await cleanup_audio_files_async(os.path.dirname(queued[0]), max(5, len(queued)))
     
     async def process_audio_queue(self):
         """Process the audio queue and play audio files"""
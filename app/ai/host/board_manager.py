@@ -3,16 +3,22 @@ Board generation and management for the AI host
 """
 
 import logging
-import json
 import os
 import time
+import uuid
 import asyncio
 import random
+import orjson
 from typing import List, Dict, Any
 from app.ai.board_generation.generator import BoardGenerator
 
 logger = logging.getLogger(__name__)
 
+def _write_board_file(file_path, board_data):
+    """Write board data to a JSON file (blocking; run it in a worker thread)."""
+    with open(file_path, 'wb') as f:
+        f.write(orjson.dumps(board_data))
+
 class BoardManager:
     """Manages board generation and selection for the AI host"""
     
@@ -44,9 +50,12 @@ class BoardManager:
             categories = await generator.generate_categories()
             logger.info(f"Generated categories: {categories}")
             
+            # Final Jeopardy doesn't depend on the categories, so generate it alongside them
+            final_task = asyncio.create_task(generator._generate_final_jeopardy())
+            
             # Generate a unique name for this game's board
-            timestamp = time.strftime("%Y%m%d%H%M%S")
-            board_name = f"generated_{timestamp}"
+            timestamp = int(time.time())
+            board_name = f"generated_{timestamp}_{uuid.uuid4().hex[:8]}"
             
             # Create placeholder board data
             board_data = {
@@ -61,8 +70,7 @@ class BoardManager:
             
             # Save initial board with placeholders
             file_path = os.path.join("app/game_data", f"{board_name}.json")
-            with open(file_path, 'w') as f:
-                json.dump(board_data, f, indent=2)
+            await asyncio.to_thread(_write_board_file, file_path, board_data)
             
             # Start all category generation tasks concurrently
             category_tasks = []
@@ -71,7 +79,11 @@ class BoardManager:
                 category_tasks.append(task)
             
             # Wait for all categories to be generated
-            category_data = await asyncio.gather(*category_tasks)
+            try:
+                category_data = await asyncio.gather(*category_tasks)
+            except Exception:
+                final_task.cancel()
+                raise
             
             # Reveal categories one by one with a small delay
             for i, cat_data in enumerate(category_data):
@@ -101,11 +113,10 @@ class BoardManager:
             
             # Generate the final object
             board_data["categories"] = category_data
-            board_data["final"] = await generator._generate_final_jeopardy()
+            board_data["final"] = await final_task
             
             # Save complete board data
-            with open(file_path, 'w') as f:
-                json.dump(board_data, f, indent=2)
+            await asyncio.to_thread(_write_board_file, file_path, board_data)
             
             # Set the board in the game service
             if self.game_service:
@@ -39,6 +39,22 @@ class ChatProcessor:
         self.clue_processor = clue_processor
         self.answer_evaluator = answer_evaluator
     
+    def answer_feedback_messages(self, username: str, explanation: str = ""):
+        """
+        Build the host's responses to a correct and an incorrect answer.
+        
+        Args:
+            username: The player who answered
+            explanation: Optional explanation appended to the response
+            
+        Returns:
+            Tuple of (correct_message, incorrect_message)
+        """
+        return (
+            f"That's correct, {username}! {explanation}",
+            f"I'm sorry, {username}, that's incorrect. {explanation}"
+        )
+    
     async def send_chat_message(self, message: str):
         """Send a chat message as the AI host."""
         if not self.game_service:
@@ -155,10 +171,10 @@ class ChatProcessor:
                 
             is_correct = evaluation_result.get("is_correct", False)
             explanation = evaluation_result.get("explanation", "")
+            correct_msg, incorrect_msg = self.answer_feedback_messages(username, explanation)
             
             # Send appropriate response based on correctness
             if is_correct:
-                correct_msg = f"That's correct, {username}! {explanation}"
                 logger.info(f"Player {username} answered correctly")
                 await self.send_chat_message(correct_msg)
                 
@@ -166,7 +182,6 @@ class ChatProcessor:
                 if hasattr(self.game_service, "ai_host") and hasattr(self.game_service.ai_host, "synthesize_and_play_speech"):
                     await self.game_service.ai_host.synthesize_and_play_speech(correct_msg)
             else:
-                incorrect_msg = f"I'm sorry, {username}, that's incorrect. {explanation}"
                 logger.info(f"Player {username} answered incorrectly")
                 await self.send_chat_message(incorrect_msg)
                 
@@ -104,6 +104,9 @@ class GameFlowManager:
                 # Update our state
                 self.game_state_manager.set_buzzed_player(player_name, set())
                 
+                # Synthesize both possible reactions while the answer is being evaluated
+                self.audio_manager.prefetch_speech(self.chat_processor.answer_feedback_messages(player_name))
+                
                 # Let players know they're being evaluated
                 await self.chat_processor.send_chat_message(f"Let me evaluate {player_name}'s answer...")
                 
@@ -266,7 +269,7 @@ class GameFlowManager:
             # Force inclusion of user messages that might have been missed
             if len(preference_messages) == 0 and len(self.game_state_manager.recent_chat_messages) > 0:
                 logger.info("Preference messages collection failed - forcing use of recent_chat_messages")
-                preference_messages = self.game_state_manager.recent_chat_messages
+                preference_messages = list(self.game_state_manager.recent_chat_messages)
                 logger.info(f"Forced preference messages: {len(preference_messages)}")
             
             # Log a sample of the messages for debugging
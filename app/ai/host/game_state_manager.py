@@ -4,7 +4,8 @@ Game state management for the AI host
 
 import logging
 import time
-from typing import List, Dict, Set, Optional, Any
+from collections import deque
+from typing import List, Dict, Set, FrozenSet, Optional, Any
 from .utils.game_state import GameState
 
 logger = logging.getLogger(__name__)
@@ -36,9 +37,9 @@ class GameStateManager:
         self.answer_cooldown_time = 0
         self.answer_cooldown = 3  # seconds
         
-        # Store recent chat messages for preferences
-        self.recent_chat_messages = []  # Store recent chat messages for preferences
+        # Store recent chat messages for preferences, keeping only the most recent ones
         self.max_preference_messages = 20  # Maximum number of messages to use for preferences
+        self.recent_chat_messages = deque(maxlen=self.max_preference_messages)
         
         # Mark when we've started gathering preferences, to avoid using
         # messages after board generation has started
@@ -115,9 +116,9 @@ class GameStateManager:
         """Clear the incorrect answer attempts tracking"""
         self.incorrect_attempts.clear()
         
-    def get_incorrect_attempts(self) -> Set[str]:
-        """Get the set of players who have given incorrect answers"""
-        return self.incorrect_attempts
+    def get_incorrect_attempts(self) -> FrozenSet[str]:
+        """Get a snapshot of the players who have given incorrect answers"""
+        return frozenset(self.incorrect_attempts)
     
     def should_check_for_clue_selection(self) -> bool:
         """Check if we should be checking for clue selection messages"""
@@ -148,15 +149,12 @@ class GameStateManager:
         if len(message) <= 3:
             return  # Still filter out very short messages
             
+        # The deque drops the oldest message once the limit is reached
         self.recent_chat_messages.append({
             "username": username,
             "message": message
         })
         
-        # Keep only the most recent messages
-        if len(self.recent_chat_messages) > self.max_preference_messages:
-            self.recent_chat_messages.pop(0)
-        
         logger.info(f"Stored chat message for preferences: {username}: {message}")
         
     def add_player_preference(self, username: str, preference: str):
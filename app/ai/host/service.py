@@ -7,8 +7,8 @@ directly through the backend, eliminating the need for Selenium.
 
 import logging
 import asyncio
-import time
 import os
+from functools import cached_property
 from typing import Optional
 
 from .audio_manager import AudioManager
@@ -19,7 +19,8 @@ from .clue_processor import ClueProcessor
 from .chat_processor import ChatProcessor
 from .buzzer_manager import BuzzerManager
 from .game_flow_manager import GameFlowManager
-from .utils.helpers import is_same_player, cleanup_audio_files
+from .utils.helpers import is_same_player
+from ..utils.llm import close_shared_llm_client
 
 logger = logging.getLogger(__name__)
 
@@ -45,18 +46,7 @@ class AIHostService:
         self.inworld_api_key = os.environ.get("INWORLD_API_KEY")
         self.tts_voice = "Timothy"
         
-        # Initialize component managers
-        self.game_state_manager = GameStateManager()
-        self.audio_manager = AudioManager(api_key=self.inworld_api_key, voice=self.tts_voice)
-        self.answer_evaluator = AnswerEvaluator()
-        self.board_manager = BoardManager()
-        self.clue_processor = ClueProcessor()
-        self.chat_processor = ChatProcessor()
-        self.buzzer_manager = BuzzerManager()
-        self.game_flow_manager = GameFlowManager()
-        
-        # Set up the chat processor
-        self.chat_processor.set_host_name(name)
+        # Component managers are created lazily on first access (see the properties below)
         
         # WebSocket connection manager reference (to be set from outside)
         self.websocket_manager = None
@@ -64,6 +54,51 @@ class AIHostService:
         # Game service reference (to be set from outside)
         self.game_service = None
         
+        # Set whenever tracked state changes so the game loop can react immediately
+        self._state_dirty = asyncio.Event()
+    
+    @cached_property
+    def game_state_manager(self) -> GameStateManager:
+        """Game state manager tracking the host's view of the game."""
+        return GameStateManager()
+    
+    @cached_property
+    def audio_manager(self) -> AudioManager:
+        """Audio manager for speech synthesis and playback."""
+        return AudioManager(api_key=self.inworld_api_key, voice=self.tts_voice)
+    
+    @cached_property
+    def answer_evaluator(self) -> AnswerEvaluator:
+        """Answer evaluator for player responses."""
+        return AnswerEvaluator()
+    
+    @cached_property
+    def board_manager(self) -> BoardManager:
+        """Board manager for board generation and loading."""
+        return BoardManager()
+    
+    @cached_property
+    def clue_processor(self) -> ClueProcessor:
+        """Clue processor for clue selections."""
+        return ClueProcessor()
+    
+    @cached_property
+    def chat_processor(self) -> ChatProcessor:
+        """Chat processor, set up with the host name."""
+        chat_processor = ChatProcessor()
+        chat_processor.set_host_name(self.name)
+        return chat_processor
+    
+    @cached_property
+    def buzzer_manager(self) -> BuzzerManager:
+        """Buzzer manager for buzzer state and timeouts."""
+        return BuzzerManager()
+    
+    @cached_property
+    def game_flow_manager(self) -> GameFlowManager:
+        """Game flow manager for monitoring and progressing the game."""
+        return GameFlowManager()
+        
     async def start(self) -> bool:
         """Start the AI host service."""
         try:
@@ -82,13 +117,24 @@ class AIHostService:
     def shutdown(self):
         """Shut down the AI host service and clean up resources."""
         try:
-            # Shut down audio manager
-            self.audio_manager.shutdown()
+            # Shut down audio manager (only if it was ever created)
+            if "audio_manager" in self.__dict__:
+                self.audio_manager.shutdown()
                 
             logger.info("AI host service shut down")
         except Exception as e:
             logger.error(f"Error shutting down AI host service: {e}")
     
+    async def aclose(self):
+        """Shut down the AI host service and close its HTTP sessions."""
+        try:
+            if "audio_manager" in self.__dict__:
+                await self.audio_manager.aclose()
+            await close_shared_llm_client()
+            logger.info("AI host service closed")
+        except Exception as e:
+            logger.error(f"Error closing AI host service: {e}")
+    
     def set_websocket_manager(self, websocket_manager):
         """Set the WebSocket manager for communication with frontend clients."""
         self.websocket_manager = websocket_manager
@@ -131,6 +177,10 @@ class AIHostService:
         
         logger.info("Game service set for AI Host Service")
     
+    def notify_state_change(self):
+        """Wake up the game loop because tracked game state has changed."""
+        self._state_dirty.set()
+    
     async def send_chat_message(self, message: str):
         """Send a chat message as the AI host."""
         return await self.chat_processor.send_chat_message(message)
@@ -161,6 +211,9 @@ class AIHostService:
         """
         # Forward to the chat processor
         await self.chat_processor.process_chat_message(username, message)
+        
+        # Chat messages may have answered or selected a clue, so re-check state now
+        self.notify_state_change()
     
     async def run(self):
         """Main game loop for monitoring the game and managing interactions."""
@@ -169,29 +222,43 @@ class AIHostService:
         try:
             game_error_count = 0
             max_errors = 5
+            max_backoff = 30
+            last_error_type = None
             
             while True:
                 try:
                     # Monitor the game state using the game flow manager
                     await self.monitor_game_state()
                     
-                    # Small delay between checks
-                    await asyncio.sleep(1)
+                    # Wait for a state change, falling back to a 1 second heartbeat
+                    try:
+                        await asyncio.wait_for(self._state_dirty.wait(), timeout=1.0)
+                    except asyncio.TimeoutError:
+                        pass
+                    finally:
+                        self._state_dirty.clear()
                     
                 except Exception as e:
                     game_error_count += 1
                     logger.error(f"Error in game loop (attempt {game_error_count}/{max_errors}): {e}")
                     
-                    # Log traceback for debugging
-                    import traceback
-                    logger.error(traceback.format_exc())
+                    # Log traceback only for the first occurrence of an error burst
+                    if type(e) is not last_error_type:
+                        import traceback
+                        logger.error(traceback.format_exc())
+                        last_error_type = type(e)
                     
-                    # Longer backoff on repeated errors
-                    await asyncio.sleep(2)
+                    # Exponential backoff on repeated errors
+                    await asyncio.sleep(min(max_backoff, 0.5 * (2 ** game_error_count)))
                     
-                    # Reset error count after maxing out
+                    # Reset error count (and backoff) after maxing out
                     if game_error_count > max_errors:
                         game_error_count = 0
+                    continue
+                
+                # Healthy iteration, so the next error starts a new burst
+                game_error_count = 0
+                last_error_type = None
                         
         except Exception as e:
             logger.error(f"Fatal error in game loop: {e}")
@@ -3,13 +3,17 @@ Game state tracking for the AI host
 """
 
 import logging
+import sys
 import time
-from typing import Dict, List, Set, Any, Optional
-from collections import deque, defaultdict
+from typing import AbstractSet, Dict, List, Set, Any, Optional
+from collections import Counter, deque, defaultdict
 from dataclasses import dataclass, field
 
 logger = logging.getLogger(__name__)
 
+# Shared empty set used until a question gets its first incorrect attempt
+_EMPTY_ATTEMPTS: AbstractSet[str] = frozenset()
+
 @dataclass
 class Question:
     """Represents a Jeopardy question"""
@@ -48,11 +52,11 @@ class GameState:
     
     # Question state
     current_question: Optional[Dict[str, Any]] = None
-    incorrect_attempts: Set[str] = field(default_factory=set)
-    read_questions: Set[str] = field(default_factory=set)
+    incorrect_attempts: AbstractSet[str] = _EMPTY_ATTEMPTS
+    read_questions: Set[int] = field(default_factory=set)  # hashes of question texts
     
     # Chat history for preferences
-    recent_chat_messages: List[Dict[str, Any]] = field(default_factory=list)
+    recent_chat_messages: deque = field(default_factory=lambda: deque(maxlen=50))
     chat_history: deque = field(default_factory=lambda: deque(maxlen=200))
     
     # Board state  
@@ -60,7 +64,7 @@ class GameState:
     board_generated: bool = False
     
     # Track player selection patterns
-    category_selections: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    category_selections: Dict[str, Counter] = field(default_factory=lambda: defaultdict(Counter))
     
     def reset(self):
         """Reset the game state for a new game"""
@@ -77,16 +81,16 @@ class GameState:
         self.buzzed_player = None
         
         self.current_question = None
-        self.incorrect_attempts = set()
-        self.read_questions = set()
+        self.incorrect_attempts = _EMPTY_ATTEMPTS
+        self.read_questions.clear()
         
-        self.recent_chat_messages = []
+        self.recent_chat_messages.clear()
         
-        self.categories = []
+        self.categories.clear()
         self.board_generated = False
         
         # Reset selection patterns
-        self.category_selections = defaultdict(int)
+        self.category_selections.clear()
     
     # Getter/setter methods for cleaner API access
     
@@ -124,7 +128,8 @@ class GameState:
     
     def add_player(self, player_name: str):
         """Add a player to the game state"""
-        self.player_names.add(player_name)
+        # Intern so the name is shared by every structure that references the player
+        self.player_names.add(sys.intern(player_name))
     
     def get_player_with_control(self) -> Optional[str]:
         """Get the player with control of the board"""
@@ -144,6 +149,8 @@ class GameState:
     
     def track_incorrect_attempt(self, player_name: str):
         """Track an incorrect answer attempt"""
+        if self.incorrect_attempts is _EMPTY_ATTEMPTS:
+            self.incorrect_attempts = set()
         self.incorrect_attempts.add(player_name)
     
     def set_question(self, text: str, answer: str, category: str, value: int):
@@ -151,22 +158,23 @@ class GameState:
         self.current_question = {
             "text": text,
             "answer": answer,
-            "category": category,
+            "category": sys.intern(category),
             "value": value
         }
     
     def has_question_been_read(self, question_text: str) -> bool:
         """Check if a question has been read already"""
-        return question_text in self.read_questions
+        return hash(question_text) in self.read_questions
     
     def mark_question_read(self, question_text: str):
         """Mark a question as having been read"""
-        self.read_questions.add(question_text)
+        # Only the hash is kept; the full question text isn't needed for lookups
+        self.read_questions.add(hash(question_text))
     
     def reset_question(self):
         """Reset the current question"""
         self.current_question = None
-        self.incorrect_attempts = set()
+        self.incorrect_attempts = _EMPTY_ATTEMPTS
     
     def record_category_selection(self, player: str, category: str):
         """Record a player's category selection"""
@@ -174,8 +182,7 @@ class GameState:
             return
             
         # Track which categories a player selects
-        key = f"{player}:{category}"
-        self.category_selections[key] += 1
+        self.category_selections[player][category] += 1
         
     def get_player_preferred_categories(self, player: str) -> List[str]:
         """
@@ -187,13 +194,9 @@ class GameState:
         Returns:
             List of categories sorted by selection frequency
         """
-        # Extract all selections for this player
-        selections = {}
-        for key, count in self.category_selections.items():
-            if key.startswith(f"{player}:"):
-                category = key.split(":", 1)[1]
-                selections[category] = count
-                
+        selections = self.category_selections.get(player)
+        if not selections:
+            return []
+        
         # Sort by frequency (descending)
-        sorted_categories = sorted(selections.items(), key=lambda x: x[1], reverse=True)
-        return [category for category, _ in sorted_categories]
\ No newline at end of file
+        return [category for category, _ in selections.most_common()]
\ No newline at end of file
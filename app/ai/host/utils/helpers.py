@@ -2,23 +2,34 @@
 Helper functions for the AI host system
 """
 
+import asyncio
+import functools
+import heapq
 import logging
 import os
 import re
 
 logger = logging.getLogger(__name__)
 
+@functools.lru_cache(maxsize=512)
+def _lower(value: str) -> str:
+    """Lowercase a username, cached since the set of player names is small."""
+    return value.lower()
+
 def is_same_player(username1: str, username2: str) -> bool:
     """Check if two usernames refer to the same player (with flexible matching)."""
     if not username1 or not username2:
         return False
+    
+    # Fast path for the common case of identical usernames
+    if username1 is username2 or username1 == username2:
+        return True
         
-    username1 = username1.lower()
-    username2 = username2.lower()
+    username1 = _lower(username1)
+    username2 = _lower(username2)
     
+    # Substring containment also covers the prefix matches
     return (username1 == username2 or
-            username1.startswith(username2) or
-            username2.startswith(username1) or
             username1 in username2 or
             username2 in username1)
 
@@ -31,18 +42,19 @@ def cleanup_audio_files(directory: str, max_files: int = 5):
         max_files: Maximum number of files to keep
     """
     try:
-        # Get list of audio files in the directory
-        audio_files = []
-        for filename in os.listdir(directory):
-            if filename.startswith("question_audio_") and filename.endswith(".wav"):
-                file_path = os.path.join(directory, filename)
-                audio_files.append((file_path, os.path.getmtime(file_path)))
+        # Get list of audio files in the directory (DirEntry caches its stat result)
+        with os.scandir(directory) as entries:
+            audio_files = [(entry.path, entry.stat().st_mtime) for entry in entries
+                           if entry.name.startswith("question_audio_") and entry.name.endswith(".wav")]
         
-        # Sort files by modification time (newest first)
-        audio_files.sort(key=lambda x: x[1], reverse=True)
+        if len(audio_files) <= max_files:
+            return
         
-        # Delete older files beyond the max_files limit
-        for file_path, _ in audio_files[max_files:]:
+        # Keep the newest files by modification time and delete the rest
+        keep = {file_path for file_path, _ in heapq.nlargest(max_files, audio_files, key=lambda x: x[1])}
+        for file_path, _ in audio_files:
+            if file_path in keep:
+                continue
             try:
                 os.remove(file_path)
                 logger.info(f"Removed old audio file: {file_path}")
@@ -50,4 +62,14 @@ def cleanup_audio_files(directory: str, max_files: int = 5):
                 logger.error(f"Failed to remove audio file {file_path}: {e}")
         
     except Exception as e:
-        logger.error(f"Error cleaning up audio files in {directory}: {e}") 
\ No newline at end of file
+        logger.error(f"Error cleaning up audio files in {directory}: {e}") 
+
+async def cleanup_audio_files_async(directory: str, max_files: int = 5):
+    """
+    Run cleanup_audio_files in a worker thread so the event loop isn't blocked.
+    
+    Args:
+        directory: The directory containing audio files
+        max_files: Maximum number of files to keep
+    """
+    return await asyncio.to_thread(cleanup_audio_files, directory, max_files)
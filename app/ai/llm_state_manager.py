@@ -1,8 +1,10 @@
-from enum import Enum, auto
+from enum import Enum
 from typing import Dict, Any, List, Optional
+from dataclasses import dataclass, field
 import logging
-from pydantic import BaseModel
-import json
+import sys
+
+import orjson
 
 logger = logging.getLogger(__name__)
 
@@ -15,8 +17,14 @@ class LLMGameState(str, Enum):
     MAKING_WAGER = "MAKING_WAGER"
     GAME_OVER = "GAME_OVER"
 
-class AIPlayerState(BaseModel):
-    """State information for an AI player."""
+@dataclass(slots=True)
+class AIPlayerState:
+    """
+    State information for an AI player.
+    
+    Fields are only set internally by the state manager, so this is a plain
+    slotted dataclass rather than a validated model.
+    """
     name: str
     state: LLMGameState = LLMGameState.GAME_OVER
     category: Optional[str] = None
@@ -25,13 +33,39 @@ class AIPlayerState(BaseModel):
     player_score: int = 0
     wager_type: Optional[str] = None
     max_wager: Optional[int] = None
-    available_categories: List[str] = []
-    available_values: List[int] = []
+    available_categories: List[str] = field(default_factory=list)
+    available_values: List[int] = field(default_factory=list)
     buzzing_player: Optional[str] = None
+    # Cached results of to_dict() and to_json_bytes(), cleared whenever a field is assigned
+    _cached_dict: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+    _cached_json: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if not name.startswith("_cached"):
+            object.__setattr__(self, "_cached_dict", None)
+            object.__setattr__(self, "_cached_json", None)
+    
+    def set_question(self, state: LLMGameState, category: Optional[str], value: Optional[int],
+                     question_text: Optional[str], buzzing_player: Optional[str]) -> None:
+        """Set the question-related fields in one call."""
+        self.state = state
+        self.category = category
+        self.value = value
+        self.question_text = question_text
+        self.buzzing_player = buzzing_player
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert state to a dictionary for LLM input."""
-        return {
+        """
+        Convert state to a dictionary for LLM input.
+        
+        The dictionary is cached until the next field assignment, so callers
+        must treat it as read-only.
+        """
+        if self._cached_dict is not None:
+            return self._cached_dict
+        
+        self._cached_dict = {
             "state": self.state,
             "category": self.category,
             "question_text": self.question_text,
@@ -43,6 +77,13 @@ class AIPlayerState(BaseModel):
             "available_values": self.available_values,
             "buzzing_player": self.buzzing_player
         }
+        return self._cached_dict
+    
+    def to_json_bytes(self) -> bytes:
+        """Serialize the state dictionary to JSON, cached until the next field assignment."""
+        if self._cached_json is None:
+            self._cached_json = orjson.dumps(self.to_dict())
+        return self._cached_json
 
 class LLMStateManager:
     """
@@ -50,15 +91,8 @@ class LLMStateManager:
     This class maps game events to LLM states and maintains context
     for each AI player in the game.
     """
-    _instance = None
     
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super(LLMStateManager, cls).__new__(cls)
-            cls._instance.initialize()
-        return cls._instance
-    
-    def initialize(self):
+    def __init__(self):
         """Initialize the state manager."""
         self.player_states: Dict[str, AIPlayerState] = {}
         self.available_categories: List[str] = []
@@ -71,13 +105,15 @@ class LLMStateManager:
             logger.warning(f"AI player {name} already registered")
             return
         
+        name = sys.intern(name)
         self.player_states[name] = AIPlayerState(name=name)
         logger.info(f"AI player {name} registered with state manager")
     
     def update_categories(self, categories: List[str]) -> None:
         """Update available categories."""
+        categories = [sys.intern(category) for category in categories]
         self.available_categories = categories
-        logger.info(f"Updated available categories: {categories}")
+        logger.info("Updated available categories: %s", categories)
         
         # Update for all AI players
         for player_state in self.player_states.values():
@@ -92,15 +128,14 @@ class LLMStateManager:
             value: The dollar value of the question
             question_text: The text of the question
         """
-        logger.info(f"Question displayed: {category}, ${value}, '{question_text}'")
-        
-        for name, player_state in self.player_states.items():
-            player_state.state = LLMGameState.QUESTION_DISPLAYED
-            player_state.category = category
-            player_state.value = value
-            player_state.question_text = question_text
-            player_state.buzzing_player = None
-            logger.debug(f"Updated AI player {name} for question displayed")
+        logger.info("Question displayed: %s, $%s, '%s'", category, value, question_text)
+        
+        update = (LLMGameState.QUESTION_DISPLAYED, category, value, question_text, None)
+        for player_state in self.player_states.values():
+            player_state.set_question(*update)
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Updated {len(self.player_states)} AI players for question displayed")
     
     def player_buzzed_in(self, player_name: str) -> None:
         """
@@ -109,16 +144,18 @@ class LLMStateManager:
         Args:
             player_name: The name of the player who buzzed in
         """
-        logger.info(f"Player buzzed in: {player_name}")
+        logger.info("Player buzzed in: %s", player_name)
         
-        for name, player_state in self.player_states.items():
+        for player_state in self.player_states.values():
             player_state.state = LLMGameState.PLAYER_BUZZED_IN
             player_state.buzzing_player = player_name
-            
-            # If this AI player buzzed in, they should prepare to answer
-            if name == player_name:
-                player_state.state = LLMGameState.AWAITING_ANSWER
-                logger.debug(f"AI player {name} is now awaiting answer")
+        
+        # If this AI player buzzed in, they should prepare to answer
+        buzzing_state = self.player_states.get(player_name)
+        if buzzing_state is not None:
+            buzzing_state.state = LLMGameState.AWAITING_ANSWER
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"AI player {player_name} is now awaiting answer")
     
     def selecting_question(self, player_name: str) -> None:
         """
@@ -127,15 +164,17 @@ class LLMStateManager:
         Args:
             player_name: The name of the player who needs to select
         """
-        logger.info(f"Player {player_name} is selecting a question")
-        
-        for name, player_state in self.player_states.items():
-            # Only the player whose turn it is should be in SELECTING_QUESTION state
-            if name == player_name:
-                player_state.state = LLMGameState.SELECTING_QUESTION
-                logger.debug(f"AI player {name} is now selecting a question")
-            else:
-                player_state.state = LLMGameState.GAME_OVER
+        logger.info("Player %s is selecting a question", player_name)
+        
+        for player_state in self.player_states.values():
+            player_state.state = LLMGameState.GAME_OVER
+        
+        # Only the player whose turn it is should be in SELECTING_QUESTION state
+        selecting_state = self.player_states.get(player_name)
+        if selecting_state is not None:
+            selecting_state.state = LLMGameState.SELECTING_QUESTION
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"AI player {player_name} is now selecting a question")
     
     def making_wager(self, player_name: str, wager_type: str, max_wager: int) -> None:
         """
@@ -146,15 +185,16 @@ class LLMStateManager:
             wager_type: The type of wager (Daily Double or Final Jeopardy)
             max_wager: The maximum allowed wager amount
         """
-        logger.info(f"Player {player_name} is making a {wager_type} wager (max: ${max_wager})")
-        
-        for name, player_state in self.player_states.items():
-            # Only the player who needs to make a wager should be in MAKING_WAGER state
-            if name == player_name:
-                player_state.state = LLMGameState.MAKING_WAGER
-                player_state.wager_type = wager_type
-                player_state.max_wager = max_wager
-                logger.debug(f"AI player {name} is now making a wager")
+        logger.info("Player %s is making a %s wager (max: $%s)", player_name, wager_type, max_wager)
+        
+        # Only the player who needs to make a wager should be in MAKING_WAGER state
+        player_state = self.player_states.get(player_name)
+        if player_state is not None:
+            player_state.state = LLMGameState.MAKING_WAGER
+            player_state.wager_type = wager_type
+            player_state.max_wager = max_wager
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"AI player {player_name} is now making a wager")
     
     def update_player_score(self, player_name: str, score: int) -> None:
         """
@@ -166,19 +206,17 @@ class LLMStateManager:
         """
         if player_name in self.player_states:
             self.player_states[player_name].player_score = score
-            logger.debug(f"Updated AI player {player_name} score to ${score}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Updated AI player {player_name} score to ${score}")
     
     def question_dismissed(self) -> None:
         """Update state when a question is dismissed."""
         logger.info("Question dismissed")
         
+        # Reset to default game state
+        update = (LLMGameState.GAME_OVER, None, None, None, None)
         for player_state in self.player_states.values():
-            # Reset to default game state
-            player_state.state = LLMGameState.GAME_OVER
-            player_state.category = None
-            player_state.question_text = None
-            player_state.value = None
-            player_state.buzzing_player = None
+            player_state.set_question(*update)
     
     def get_player_state(self, player_name: str) -> Optional[Dict[str, Any]]:
         """
@@ -194,4 +232,15 @@ class LLMStateManager:
             logger.warning(f"AI player {player_name} not found in state manager")
             return None
         
-        return self.player_states[player_name].to_dict() 
\ No newline at end of file
+        return self.player_states[player_name].to_dict() 
+
+
+# Shared state manager instance, created on first use
+_LLM_STATE_MANAGER: Optional[LLMStateManager] = None
+
+def get_llm_state_manager() -> LLMStateManager:
+    """Get the shared LLM state manager, creating it on first use."""
+    global _LLM_STATE_MANAGER
+    if _LLM_STATE_MANAGER is None:
+        _LLM_STATE_MANAGER = LLMStateManager()
+    return _LLM_STATE_MANAGER
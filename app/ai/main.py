@@ -1,4 +1,4 @@
-from .utils.llm import LLMClient, LLMConfig
+from .utils.llm import LLMClient, LLMConfig, close_shared_llm_client
 from .player import AIPlayer
 import asyncio
 import json
@@ -22,14 +22,11 @@ async def test_llm():
         logger.info(f"LLM response: {response}")
     except Exception as e:
         logger.error(f"Error making LLM call: {e}")
+    finally:
+        await llm.aclose()
 
-async def test_ai_player():
-    """Test AI player functionality."""
-    logger.info("Testing AI player functionality...")
-    
-    # Create an AI player with a personality
-    ai_player = AIPlayer(name="Watson", personality="knowledgeable and slightly arrogant")
-    
+async def run_question_scenario(ai_player):
+    """Scenarios 1 and 2: respond to a displayed question, then answer if the AI buzzed in."""
     # Test scenario 1: Question displayed
     question_state = {
         "state": "QUESTION_DISPLAYED",
@@ -61,7 +58,10 @@ async def test_ai_player():
         answer_response = await ai_player.get_action()
         logger.info(f"AI player answer: {answer_response}")
     
-    # Test scenario 3: Selecting a question
+    return question_response
+
+async def run_selection_scenario(ai_player):
+    """Scenario 3: select a question from the board."""
     selection_state = {
         "state": "SELECTING_QUESTION",
         "available_categories": ["Science", "History", "Literature", "Sports"],
@@ -75,8 +75,10 @@ async def test_ai_player():
     logger.info("Getting AI player selection...")
     selection_response = await ai_player.get_action()
     logger.info(f"AI player question selection: {selection_response}")
-    
-    # Test scenario 4: Making a wager
+    return selection_response
+
+async def run_wager_scenario(ai_player):
+    """Scenario 4: make a Daily Double wager."""
     wager_state = {
         "state": "MAKING_WAGER",
         "wager_type": "Daily Double",
@@ -90,14 +92,30 @@ async def test_ai_player():
     logger.info("Getting AI player wager...")
     wager_response = await ai_player.get_action()
     logger.info(f"AI player wager: {wager_response}")
+    return wager_response
+
+async def test_ai_player():
+    """Test AI player functionality."""
+    logger.info("Testing AI player functionality...")
+    
+    # Each independent scenario gets its own player (same name and personality)
+    # so their states don't interfere and the LLM calls can run concurrently
+    def create_player():
+        return AIPlayer(name="Watson", personality="knowledgeable and slightly arrogant")
+    
+    await asyncio.gather(
+        run_question_scenario(create_player()),
+        run_selection_scenario(create_player()),
+        run_wager_scenario(create_player())
+    )
 
 async def main():
     """Main function to run tests."""
-    # Test basic LLM functionality
-    await test_llm()
-    
-    # Test AI player functionality
-    await test_ai_player()
+    # Test basic LLM functionality and AI player functionality concurrently
+    try:
+        await asyncio.gather(test_llm(), test_ai_player())
+    finally:
+        await close_shared_llm_client()
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -1,9 +1,14 @@
 from enum import Enum, auto
-import json
-from typing import Dict, Any, List, Optional
+from collections import OrderedDict, deque
+import hashlib
+from typing import Deque, Dict, Any, Optional
 import logging
 
-from .utils.llm import LLMClient, LLMConfig
+import orjson
+from jinja2 import Template
+
+from .utils.llm import LLMConfig, get_shared_llm_client
+from .utils.prompt_manager import PromptManager
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +24,31 @@ class GameState(Enum):
 class AIPlayer:
     """AI player for Jeopardy game using LLM for decision making."""
     
+    # Templates whose context has no free-text question, so the same context
+    # can safely reuse an earlier decision instead of calling the LLM again
+    CACHEABLE_TEMPLATES = frozenset({"selection_prompt.j2", "wager_prompt.j2"})
+    DECISION_CACHE_SIZE = 512
+    
+    # Templates used by AI players, compiled once and shared by all instances
+    SYSTEM_TEMPLATE = "player_system_prompt.j2"
+    PLAYER_TEMPLATES = (
+        "question_prompt.j2",
+        "answer_prompt.j2",
+        "selection_prompt.j2",
+        "wager_prompt.j2",
+        "generic_prompt.j2",
+        SYSTEM_TEMPLATE,
+    )
+    _templates: Optional[Dict[str, Template]] = None
+    
+    @classmethod
+    def _get_templates(cls) -> Dict[str, Template]:
+        """Get the compiled player templates, compiling them on first use."""
+        if cls._templates is None:
+            prompt_manager = PromptManager()
+            cls._templates = {name: prompt_manager.get_template(name) for name in cls.PLAYER_TEMPLATES}
+        return cls._templates
+    
     def __init__(self, name: str, personality: str = "competitive and knowledgeable"):
         """
         Initialize an AI player.
@@ -29,9 +59,11 @@ class AIPlayer:
         """
         self.name = name
         self.personality = personality
-        self.llm_client = LLMClient()
+        self.llm_client = get_shared_llm_client()
         self.current_state: Dict[str, Any] = {}
-        self.game_history: List[Dict[str, Any]] = []
+        # Limit history size to avoid token limits
+        self.game_history: Deque[Dict[str, Any]] = deque(maxlen=10)
+        self._decision_cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
         
         # Create a response format that enforces JSON
         self.llm_config = LLMConfig(
@@ -39,6 +71,26 @@ class AIPlayer:
             response_format={"type": "json_object"}
         )
         
+        # The system prompt only depends on the player's identity, so render it
+        # once and send the identical string every turn (lets the LLM server
+        # reuse its cached prefix)
+        self._system_prompt = self.render(
+            self.SYSTEM_TEMPLATE, {"name": self.name, "personality": self.personality}
+        )
+    
+    def render(self, template_name: str, context: Dict[str, Any]) -> str:
+        """
+        Render one of the precompiled player templates.
+        
+        Args:
+            template_name: Name of the template file
+            context: Variables to pass to the template
+            
+        Returns:
+            Rendered template as a string
+        """
+        return self._get_templates()[template_name].render(**context)
+        
     def update_state(self, state: Dict[str, Any]) -> None:
         """
         Update the AI player's knowledge of the current game state.
@@ -46,12 +98,9 @@ class AIPlayer:
         Args:
             state: Dictionary containing current game state information
         """
-        # Keep track of previous states for context
+        # Keep track of previous states for context (the deque drops the oldest)
         if self.current_state:
             self.game_history.append(self.current_state)
-            # Limit history size to avoid token limits
-            if len(self.game_history) > 10:
-                self.game_history.pop(0)
         
         self.current_state = state
     
@@ -69,22 +118,32 @@ class AIPlayer:
         state_str = self.current_state.get("state", "UNKNOWN")
         template, context = self._get_template_and_context(state_str)
         
+        # Reuse an earlier decision for an identical selection/wager context
+        cache_key = None
+        if template in self.CACHEABLE_TEMPLATES:
+            cache_key = self._decision_cache_key(template, context)
+            cached = self._decision_cache.get(cache_key)
+            if cached is not None:
+                self._decision_cache.move_to_end(cache_key)
+                logger.debug(f"AI Player {self.name} reused cached action: {cached}")
+                return dict(cached)
+        
         try:
-            # Call the LLM with templates
-            response_text = await self.llm_client.chat_with_template(
-                user_template=template,
-                user_context=context,
-                system_template="player_system_prompt.j2",
-                system_context={"name": self.name, "personality": self.personality},
-                config=self.llm_config
-            )
+            # Render the precompiled prompt templates and send them to the LLM
+            messages = [
+                {"role": "system", "content": self._system_prompt},
+                {"role": "user", "content": self.render(template, context)}
+            ]
+            response_text = await self.llm_client.chat_completion(messages, self.llm_config)
             
             # Parse the JSON response
             try:
-                response = json.loads(response_text)
+                response = orjson.loads(response_text)
                 logger.debug(f"AI Player {self.name} action: {response}")
+                if cache_key is not None:
+                    self._store_decision(cache_key, response)
                 return response
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 logger.error(f"Failed to parse LLM response as JSON: {response_text}")
                 return {"action": "pass", "reason": "Error parsing response"}
                 
@@ -92,6 +151,63 @@ class AIPlayer:
             logger.error(f"Error getting AI action: {str(e)}")
             return {"action": "pass", "reason": f"Error: {str(e)}"}
     
+    def _decision_cache_key(self, template: str, context: Dict[str, Any]) -> bytes:
+        """Build a cache key from the template name and a canonical form of its context."""
+        canonical = orjson.dumps(context, default=str, option=orjson.OPT_SORT_KEYS)
+        return hashlib.blake2b(template.encode() + b"\0" + canonical, digest_size=16).digest()
+    
+    def _store_decision(self, cache_key: bytes, response: Dict[str, Any]) -> None:
+        """Store a decision, evicting the least recently used one when full."""
+        self._decision_cache[cache_key] = dict(response)
+        self._decision_cache.move_to_end(cache_key)
+        if len(self._decision_cache) > self.DECISION_CACHE_SIZE:
+            self._decision_cache.popitem(last=False)
+    
+    def _question_context(self) -> tuple[str, Dict[str, Any]]:
+        """Template and context for deciding whether to buzz in."""
+        return "question_prompt.j2", {
+            "category": self.current_state.get("category", "Unknown Category"),
+            "question": self.current_state.get("question_text", "Unknown Question"),
+            "value": self.current_state.get("value", 0)
+        }
+    
+    def _answer_context(self) -> tuple[str, Dict[str, Any]]:
+        """Template and context for answering a question."""
+        return "answer_prompt.j2", {
+            "category": self.current_state.get("category", "Unknown Category"),
+            "question": self.current_state.get("question_text", "Unknown Question")
+        }
+    
+    def _selection_context(self) -> tuple[str, Dict[str, Any]]:
+        """Template and context for selecting the next question."""
+        return "selection_prompt.j2", {
+            "categories": ", ".join(self.current_state.get("available_categories", [])),
+            "values": ", ".join([str(v) for v in self.current_state.get("available_values", [])])
+        }
+    
+    def _wager_context(self) -> tuple[str, Dict[str, Any]]:
+        """Template and context for making a wager."""
+        return "wager_prompt.j2", {
+            "wager_type": self.current_state.get("wager_type", "Unknown"),
+            "max_wager": self.current_state.get("max_wager", 0),
+            "current_score": self.current_state.get("player_score", 0)
+        }
+    
+    def _generic_context(self) -> tuple[str, Dict[str, Any]]:
+        """Template and context for any state without a dedicated prompt."""
+        return "generic_prompt.j2", {
+            "current_state": orjson.dumps(self.current_state, default=str, option=orjson.OPT_NON_STR_KEYS).decode(),
+            "game_history": orjson.dumps(list(self.game_history)[-3:], default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+        }
+    
+    # Maps a game state name to the method that builds its template and context
+    _STATE_HANDLERS = {
+        "QUESTION_DISPLAYED": _question_context,
+        "AWAITING_ANSWER": _answer_context,
+        "SELECTING_QUESTION": _selection_context,
+        "MAKING_WAGER": _wager_context,
+    }
+    
     def _get_template_and_context(self, state_str: str) -> tuple[str, Dict[str, Any]]:
         """
         Get the appropriate template and context for the current state.
@@ -102,30 +218,4 @@ class AIPlayer:
         Returns:
             Tuple of (template_name, context_dict)
         """
-        if state_str == "QUESTION_DISPLAYED":
-            return "question_prompt.j2", {
-                "category": self.current_state.get("category", "Unknown Category"),
-                "question": self.current_state.get("question_text", "Unknown Question"),
-                "value": self.current_state.get("value", 0)
-            }
-        elif state_str == "AWAITING_ANSWER":
-            return "answer_prompt.j2", {
-                "category": self.current_state.get("category", "Unknown Category"),
-                "question": self.current_state.get("question_text", "Unknown Question")
-            }
-        elif state_str == "SELECTING_QUESTION":
-            return "selection_prompt.j2", {
-                "categories": ", ".join(self.current_state.get("available_categories", [])),
-                "values": ", ".join([str(v) for v in self.current_state.get("available_values", [])])
-            }
-        elif state_str == "MAKING_WAGER":
-            return "wager_prompt.j2", {
-                "wager_type": self.current_state.get("wager_type", "Unknown"),
-                "max_wager": self.current_state.get("max_wager", 0),
-                "current_score": self.current_state.get("player_score", 0)
-            }
-        else:
-            return "generic_prompt.j2", {
-                "current_state": json.dumps(self.current_state),
-                "game_history": json.dumps(self.game_history[-3:] if self.game_history else [])
-            } 
\ No newline at end of file
+        return self._STATE_HANDLERS.get(state_str, AIPlayer._generic_context)(self)
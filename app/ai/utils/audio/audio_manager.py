@@ -10,12 +10,86 @@ import asyncio
 import time
 import os
 import shutil
-import requests
-from collections import deque
+import wave
+import aiohttp
 from ..tts import TTSClient
 
 logger = logging.getLogger(__name__)
 
+# Directory the backend serves /static/audio from
+BACKEND_AUDIO_DIR = "app/static/audio"
+
+# Parsed WAV durations by file path (file names are unique per utterance)
+_wav_durations = {}
+
+def get_wav_duration(path):
+    """
+    Get the playback duration of a WAV file from its header.
+    
+    Args:
+        path: Path to the WAV file
+        
+    Returns:
+        Duration in seconds, or None if the file can't be read as WAV
+    """
+    duration = _wav_durations.get(path)
+    if duration is not None:
+        return duration
+    
+    try:
+        with wave.open(path, "rb") as wav_file:
+            duration = wav_file.getnframes() / wav_file.getframerate()
+    except (OSError, EOFError, wave.Error, ZeroDivisionError):
+        return None
+    
+    if len(_wav_durations) > 100:
+        _wav_durations.clear()
+    _wav_durations[path] = duration
+    return duration
+
+def _copy_audio_file(source_path, dest_path):
+    """
+    Copy an audio file, creating the destination directory if needed.
+    
+    Returns:
+        True if the file was copied, False if source and destination are the same file
+    """
+    os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+    if os.path.abspath(source_path) == os.path.abspath(dest_path):
+        return False
+    shutil.copyfile(source_path, dest_path)
+    return True
+
+def _cleanup_audio_files(directory, max_files=5):
+    """
+    Keep only the most recent question audio files in a directory, deleting older ones.
+    
+    Args:
+        directory: The directory containing audio files
+        max_files: Maximum number of files to keep
+    """
+    try:
+        # scandir entries carry their stat info, avoiding a separate stat call per file
+        with os.scandir(directory) as entries:
+            audio_files = [
+                (entry.path, entry.stat().st_mtime) for entry in entries
+                if entry.name.startswith("question_audio_") and entry.name.endswith(".wav")
+            ]
+        
+        # Sort files by modification time (newest first)
+        audio_files.sort(key=lambda x: x[1], reverse=True)
+        
+        # Delete older files beyond the max_files limit
+        for file_path, _ in audio_files[max_files:]:
+            try:
+                os.remove(file_path)
+                logger.info(f"Removed old audio file: {file_path}")
+            except Exception as e:
+                logger.error(f"Failed to remove audio file {file_path}: {e}")
+        
+    except Exception as e:
+        logger.error(f"Error cleaning up audio files in {directory}: {e}")
+
 class AudioManager:
     """
     Manages audio synthesis and playback for the AI host.
@@ -36,13 +110,11 @@ class AudioManager:
         self.browser = browser
         self.tts_voice = voice_name
         self.tts_client = TTSClient(api_key=api_key)
-        self.audio_queue = []
         self.audio_queue_processor = None
         self.is_running = False
         
-        # Audio queue system
-        self.audio_queue = deque()
-        self.is_playing_audio = False
+        # Audio queue system (the processor plays one item at a time)
+        self.audio_queue = asyncio.Queue()
         self.audio_queue_task = None
     
     async def start(self):
@@ -74,24 +146,15 @@ class AudioManager:
                 return
                 
             # Copy the file to the static directory where the backend can serve it
-            backend_audio_path = os.path.join("app/static/audio", os.path.basename(audio_path))
+            backend_audio_path = os.path.join(BACKEND_AUDIO_DIR, os.path.basename(audio_path))
             public_audio_path = os.path.join("/static/audio", os.path.basename(audio_path))
             
-            # Ensure the directory exists
-            os.makedirs(os.path.dirname(backend_audio_path), exist_ok=True)
-            
-            # Copy the file only if source and destination are different
-            if os.path.abspath(audio_path) != os.path.abspath(backend_audio_path):
-                shutil.copyfile(audio_path, backend_audio_path)
+            # The backend serves /static/audio for every client, so this is the only copy
+            # needed (and none if the TTS output was written there already). The copy runs
+            # in a worker thread so the event loop isn't blocked.
+            if await asyncio.to_thread(_copy_audio_file, audio_path, backend_audio_path):
                 logger.info(f"Copied audio file to backend static directory: {backend_audio_path}")
             
-            # BUGFIX: Also copy to the frontend/public directory for direct access
-            frontend_audio_path = os.path.join("app/frontend/public/audio", os.path.basename(audio_path))
-            os.makedirs(os.path.dirname(frontend_audio_path), exist_ok=True)
-            if os.path.abspath(audio_path) != os.path.abspath(frontend_audio_path):
-                shutil.copyfile(audio_path, frontend_audio_path)
-                logger.info(f"Also copied audio file to frontend public directory: {frontend_audio_path}")
-            
             # Add to queue for playback through the browser
             logger.info(f"Adding audio to queue: {public_audio_path}")
             await self.queue_audio_for_playback(public_audio_path, wait_for_playback)
@@ -103,42 +166,43 @@ class AudioManager:
         """Process the audio queue, playing one file at a time."""
         try:
             logger.info("Audio queue processor started")
-            while self.browser:  # Continue while browser is active
-                # Check if there's audio in the queue
-                if self.audio_queue and not self.is_playing_audio:
-                    self.is_playing_audio = True
-                    audio_url = self.audio_queue.popleft()
-                    logger.info(f"Playing audio from queue: {audio_url}")
-                    
-                    # Try the backend API first
+            # One HTTP session for the processor's lifetime, closed when it stops
+            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=5)) as http:
+                while self.browser:  # Continue while browser is active
+                    # Wait until there's audio in the queue
+                    audio_url = await self.audio_queue.get()
                     try:
-                        response = requests.post(
-                            "http://localhost:8000/api/play-audio",
-                            json={"audio_url": audio_url},
-                            timeout=5
-                        )
+                        logger.info(f"Playing audio from queue: {audio_url}")
                         
-                        if response.status_code == 200:
-                            logger.info(f"Successfully requested audio playback: {response.json()}")
-                        else:
-                            logger.error(f"Backend API request failed: {response.status_code}")
-                            # Fallback to direct JavaScript
+                        # Try the backend API first
+                        try:
+                            async with http.post(
+                                "http://localhost:8000/api/play-audio",
+                                json={"audio_url": audio_url}
+                            ) as response:
+                                if response.status == 200:
+                                    logger.info(f"Successfully requested audio playback: {await response.json()}")
+                                else:
+                                    logger.error(f"Backend API request failed: {response.status}")
+                                    # Fallback to direct JavaScript
+                                    self._play_audio_fallback(audio_url)
+                                
+                        except Exception as e:
+                            logger.error(f"Error sending audio play request: {e}")
                             self._play_audio_fallback(audio_url)
-                            
-                    except Exception as e:
-                        logger.error(f"Error sending audio play request: {e}")
-                        self._play_audio_fallback(audio_url)
-                    
-                    # Estimate audio duration (rough approximation)
-                    estimated_duration = 3 + (len(audio_url) / 7)  # Base 3 seconds + estimated text length
-                    logger.info(f"Estimated audio duration: {estimated_duration:.1f} seconds")
-                    
-                    # Wait for estimated playback duration before processing next audio
-                    await asyncio.sleep(estimated_duration)
-                    self.is_playing_audio = False
-                    
-                # No audio to play, wait briefly before checking again
-                await asyncio.sleep(0.1)
+                        
+                        # Use the real duration from the WAV header when available
+                        backend_path = os.path.join(BACKEND_AUDIO_DIR, os.path.basename(audio_url))
+                        estimated_duration = get_wav_duration(backend_path)
+                        if estimated_duration is None:
+                            # Rough approximation: base 3 seconds + estimated text length
+                            estimated_duration = 3 + (len(audio_url) / 7)
+                        logger.info(f"Estimated audio duration: {estimated_duration:.1f} seconds")
+                        
+                        # Wait for estimated playback duration before processing next audio
+                        await asyncio.sleep(estimated_duration)
+                    finally:
+                        self.audio_queue.task_done()
                 
         except asyncio.CancelledError:
             logger.info("Audio queue processor was cancelled")
@@ -155,27 +219,8 @@ class AudioManager:
             directory: The directory containing audio files
             max_files: Maximum number of files to keep
         """
-        try:
-            # Get list of audio files in the directory
-            audio_files = []
-            for filename in os.listdir(directory):
-                if filename.startswith("question_audio_") and filename.endswith(".wav"):
-                    file_path = os.path.join(directory, filename)
-                    audio_files.append((file_path, os.path.getmtime(file_path)))
-            
-            # Sort files by modification time (newest first)
-            audio_files.sort(key=lambda x: x[1], reverse=True)
-            
-            # Delete older files beyond the max_files limit
-            for file_path, _ in audio_files[max_files:]:
-                try:
-                    os.remove(file_path)
-                    logger.info(f"Removed old audio file: {file_path}")
-                except Exception as e:
-                    logger.error(f"Failed to remove audio file {file_path}: {e}")
-            
-        except Exception as e:
-            logger.error(f"Error cleaning up audio files in {directory}: {e}")
+        # Directory scanning and deletes are blocking I/O, so run them off the event loop
+        await asyncio.to_thread(_cleanup_audio_files, directory, max_files)
     
     def _play_audio_fallback(self, audio_url):
         """Fallback method to play audio using JavaScript."""
@@ -206,26 +251,15 @@ class AudioManager:
         """
         try:
             # Add to the queue
-            self.audio_queue.append(audio_url)
+            await self.audio_queue.put(audio_url)
             
             if wait_for_playback:
-                # Get audio duration (approximately 1 second per 15 characters of text)
-                # This is a rough estimate since we don't have direct access to the audio file's duration
-                filename = os.path.basename(audio_url)
-                estimated_duration = 1.0  # Minimum duration
-                
-                # Try to parse the filename to find the original text length
-                if '_' in filename:
-                    try:
-                        # Use file size as a rough proxy for duration if we can access it
-                        backend_path = os.path.join("app/static/audio", os.path.basename(audio_url))
-                        if os.path.exists(backend_path):
-                            file_size = os.path.getsize(backend_path)
-                            # WAV files are roughly 16KB per second of audio at 16kHz mono
-                            estimated_duration = max(1.0, file_size / 16000)
-                    except:
-                        # Default fallback duration
-                        estimated_duration = 5.0
+                # Read the duration from the WAV header, falling back to a default
+                backend_path = os.path.join(BACKEND_AUDIO_DIR, os.path.basename(audio_url))
+                estimated_duration = get_wav_duration(backend_path)
+                if estimated_duration is None:
+                    estimated_duration = 5.0
+                estimated_duration = max(1.0, estimated_duration)
                 
                 logger.info(f"Estimated audio duration: {estimated_duration:.1f} seconds")
                 await asyncio.sleep(estimated_duration)
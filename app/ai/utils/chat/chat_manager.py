@@ -4,11 +4,43 @@ Chat Manager for AI Host
 This module handles chat interactions between the AI host and players.
 """
 
+import functools
 import logging
+from selenium.common.exceptions import StaleElementReferenceException
 from selenium.webdriver.common.by import By
 
 logger = logging.getLogger(__name__)
 
+@functools.lru_cache(maxsize=512)
+def _lower(value):
+    """Lowercase a username, cached since the same few names repeat constantly."""
+    return value.lower()
+
+# Scrapes chat messages in a single round-trip, skipping any whose key is in
+# arguments[0]. Keys are built from position, user and text since the chat
+# window renders no stable message ids.
+_CHAT_MESSAGES_SCRIPT = """
+const seen = new Set(arguments[0] || []);
+const messages = [];
+document.querySelectorAll('.chat-messages .chat-message').forEach((el, index) => {
+    const userEl = el.querySelector('.message-user');
+    const textEl = el.querySelector('.message-text');
+    const username = userEl ? userEl.textContent.trim() : '';
+    const message = textEl ? textEl.textContent.trim() : '';
+    const key = index + ':' + username + ':' + message;
+    if (!seen.has(key)) {
+        messages.push({username: username, message: message, key: key});
+    }
+});
+return messages;
+"""
+
+def _names_match(username_lc, player_name_lc):
+    """Flexible match between two already-lowercased names (substring covers prefixes)."""
+    return (username_lc == player_name_lc or
+            username_lc in player_name_lc or
+            player_name_lc in username_lc)
+
 class ChatManager:
     """
     Manages chat interactions for the AI host.
@@ -26,6 +58,24 @@ class ChatManager:
         """
         self.browser = browser
         self.host_name = host_name
+        
+        # Lowercased usernames the AI host may post under
+        self._ai_host_names_lc = frozenset({"anonymous", "ai host", host_name.lower()})
+        
+        # Chat input handles are looked up once and reused until they go stale
+        self._chat_input = None
+        self._chat_button = None
+    
+    def _locate_chat_input(self):
+        """Look up and cache the chat input field and send button."""
+        self._chat_input = self.browser.find_element(By.CSS_SELECTOR, ".chat-input input")
+        self._chat_button = self.browser.find_element(By.CSS_SELECTOR, ".chat-input button")
+    
+    def _type_and_send(self, message):
+        """Type a message into the cached chat input and click send."""
+        self._chat_input.clear()
+        self._chat_input.send_keys(message)
+        self._chat_button.click()
     
     def send_chat_message(self, message):
         """
@@ -38,12 +88,15 @@ class ChatManager:
             True if the message was sent successfully, False otherwise
         """
         try:
-            chat_input = self.browser.find_element(By.CSS_SELECTOR, ".chat-input input")
-            chat_button = self.browser.find_element(By.CSS_SELECTOR, ".chat-input button")
+            if self._chat_input is None or self._chat_button is None:
+                self._locate_chat_input()
             
-            chat_input.clear()
-            chat_input.send_keys(message)
-            chat_button.click()
+            try:
+                self._type_and_send(message)
+            except StaleElementReferenceException:
+                # The chat input was re-rendered; look it up again and retry once
+                self._locate_chat_input()
+                self._type_and_send(message)
             
             # Log with AI host identifier to make debugging easier
             logger.info(f"AI host ({self.host_name}) sent message: {message}")
@@ -51,6 +104,8 @@ class ChatManager:
             
         except Exception as e:
             logger.error(f"Error sending chat message: {e}")
+            self._chat_input = None
+            self._chat_button = None
             return False
     
     def get_chat_messages(self):
@@ -61,8 +116,7 @@ class ChatManager:
             List of message dictionaries, each containing 'username', 'message', and 'key'
         """
         try:
-            from ..browser.selenium_utils import BrowserUtils
-            return BrowserUtils.get_chat_messages(self.browser)
+            return self.browser.execute_script(_CHAT_MESSAGES_SCRIPT, []) or []
         except Exception as e:
             logger.error(f"Error getting chat messages: {e}")
             return []
@@ -80,15 +134,11 @@ class ChatManager:
         """
         if not username or not player_name:
             return False
-            
-        username = username.lower()
-        player_name = player_name.lower()
         
-        return (username == player_name or
-                username.startswith(player_name) or
-                player_name.startswith(username) or
-                username in player_name or
-                player_name in username)
+        if username == player_name:
+            return True
+        
+        return _names_match(_lower(username), _lower(player_name))
     
     def is_from_ai_host(self, username):
         """
@@ -103,38 +153,34 @@ class ChatManager:
         if not username:
             return False
             
-        # Common AI host usernames
-        ai_host_names = ["Anonymous", "AI Host", self.host_name]
-        
-        # Case-insensitive comparison
-        username_lower = username.lower()
-        return any(host_name.lower() == username_lower for host_name in ai_host_names)
+        # Case-insensitive lookup against the common AI host usernames
+        return _lower(username) in self._ai_host_names_lc
     
     def get_new_messages(self, baseline_message_keys, from_player=None):
         """
         Get new messages since baseline was established.
         
         Args:
-            baseline_message_keys: Set of message keys that existed before
+            baseline_message_keys: Collection of message keys that existed before
             from_player: Optional player name to filter messages by
             
         Returns:
             List of new message dictionaries
         """
         try:
-            current_messages = self.get_chat_messages()
-            if not current_messages:
-                return []
+            # Let the browser drop baseline messages so only new ones come back
+            new_messages = self.browser.execute_script(
+                _CHAT_MESSAGES_SCRIPT, list(frozenset(baseline_message_keys or ()))
+            )
+            if not new_messages or from_player is None:
+                return new_messages or []
                 
-            # Find new messages (not in baseline)
-            new_messages = []
-            for message in current_messages:
-                if message['key'] not in baseline_message_keys:
-                    # Filter by player if requested
-                    if from_player is None or self.is_from_player(message['username'], from_player):
-                        new_messages.append(message)
-            
-            return new_messages
+            # Lowercase the player filter once rather than per message
+            from_player_lc = _lower(from_player)
+            return [
+                message for message in new_messages
+                if message['username'] and _names_match(_lower(message['username']), from_player_lc)
+            ]
             
         except Exception as e:
             logger.error(f"Error getting new messages: {e}")
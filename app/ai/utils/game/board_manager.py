@@ -5,20 +5,73 @@ This module handles the generation and management of the Jeopardy game board.
 """
 
 import logging
-import json
 import asyncio
 import os
 import time
-import requests
+import uuid
+import aiohttp
+import orjson
 from typing import List, Dict
+from selenium.webdriver.common.by import By
+from app.ai.board_generation.generator import BoardGenerator
 
 logger = logging.getLogger(__name__)
 
+# Debug screenshots are slow WebDriver round-trips, so only take them when asked to
+DEBUG_SCREENSHOTS = os.environ.get("JEOPARDY_DEBUG_SCREENSHOTS") == "1"
+
+# Locator for the board options shown when falling back to a default board
+_BOARD_OPTION_LOCATOR = (By.CLASS_NAME, "board-option")
+
+# Finds the categories that still have an unused $200 clue in a single round-trip
+_CATEGORIES_WITH_200_SCRIPT = """
+return Array.from(document.querySelectorAll('.jeopardy-board .category'))
+    .map((category, index) => {
+        const title = category.querySelector('.category-title');
+        return {
+            index: index,
+            name: title ? title.innerText.trim() : '',
+            has200: Array.from(category.querySelectorAll('.question:not(.used)'))
+                .some(question => question.innerText.trim() === '$200')
+        };
+    })
+    .filter(category => category.has200)
+    .map(category => ({index: category.index, name: category.name}));
+"""
+
+def _write_board_file(file_path, board_data):
+    """Write board data to a JSON file (blocking; run it in a worker thread)."""
+    with open(file_path, 'wb') as f:
+        f.write(orjson.dumps(board_data))
+
+async def _log_api_success(response, message):
+    """Log a successful API response without parsing its JSON body."""
+    # Read the body so the pooled connection can be reused
+    body = await response.read()
+    logger.info(f"{message} (status {response.status})")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Response body: {body.decode(errors='replace')}")
+
 class BoardManager:
     """
     Manages the generation and interaction with the Jeopardy game board.
     """
     
+    # Backend API path for each frontend signal, and whether it sends the payload
+    _SIGNAL_ENDPOINTS = {
+        "start_board_generation": ("/api/board/start-generation", False),
+        "reveal_category": ("/api/board/reveal-category", True),
+        "reveal_categories": ("/api/board/reveal-categories", True),
+    }
+    
+    # Seconds between category reveals on the frontend
+    REVEAL_INTERVAL = 1.5
+    
+    # Retry policy for signals that fail with a transport error or a 5xx response
+    SIGNAL_MAX_ATTEMPTS = 3
+    SIGNAL_RETRY_BASE_DELAY = 0.1
+    SIGNAL_RETRY_MAX_DELAY = 1.0
+    
     def __init__(self, browser=None):
         """
         Initialize the board manager.
@@ -29,6 +82,34 @@ class BoardManager:
         self.browser = browser
         self.base_url = "http://localhost:5173"
         self.api_url = "http://localhost:8000"
+        
+        # Full API URLs, built once
+        self._signal_urls = {
+            signal_type: (f"{self.api_url}{path}", send_payload)
+            for signal_type, (path, send_payload) in self._SIGNAL_ENDPOINTS.items()
+        }
+        self._url_select_board = f"{self.api_url}/api/board/select-board"
+        self._url_select_question = f"{self.api_url}/api/board/select-question"
+        
+        # Pooled HTTP session for backend API calls, created on first use
+        self._session = None
+        
+        # ID of the most recently generated board
+        self._last_board_id = None
+    
+    def _get_session(self):
+        """
+        Get the pooled HTTP session, creating it if needed.
+        
+        Returns:
+            aiohttp ClientSession reused across API calls
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=100, limit_per_host=20),
+                timeout=aiohttp.ClientTimeout(total=5)
+            )
+        return self._session
     
     async def generate_board_from_preferences(self, user_preferences):
         """
@@ -46,17 +127,13 @@ class BoardManager:
             
             # Signal frontend to show placeholder board with question marks
             logger.info("Sending start_board_generation signal")
-            success = self._send_signal_to_frontend("start_board_generation", {})
+            success = await self._send_signal_to_frontend("start_board_generation", {})
             if not success:
                 logger.error("Failed to send start_board_generation signal")
             
-            # Import the board generator
-            logger.info("Importing board generator")
-            from app.ai.board_generation.generator import BoardGenerator
-            
             # Generate the board
             logger.info("Creating board generator...")
-            timestamp = time.strftime("%Y%m%d%H%M%S")
+            timestamp = int(time.time())
             generator = BoardGenerator(user_input=user_preferences)
             
             # First, generate just the category names
@@ -64,28 +141,39 @@ class BoardManager:
             categories = await generator.generate_categories()
             logger.info(f"Generated categories: {categories}")
             
+            # Final Jeopardy doesn't depend on the categories, so generate it alongside them
+            final_task = asyncio.create_task(generator._generate_final_jeopardy())
+            
             # Generate a unique name for this game's board
-            board_name = f"generated_{timestamp}"
+            board_name = f"generated_{timestamp}_{uuid.uuid4().hex[:8]}"
             
-            # Generate questions for each category and reveal them one by one
-            all_category_data = []
-            for i, category in enumerate(categories):
-                # Generate questions for this category
+            # Generate questions for all categories concurrently
+            category_tasks = []
+            for category in categories:
                 logger.info(f"Generating questions for category: {category}")
-                cat_data = await generator.generate_questions_for_category(category)
-                all_category_data.append(cat_data)
-                
-                # Reveal this category on the frontend
-                logger.info(f"Revealing category {i+1} of {len(categories)}: {category}")
-                success = self._send_signal_to_frontend("reveal_category", {
-                    "index": i,
-                    "category": cat_data
-                })
-                if not success:
-                    logger.error(f"Failed to send reveal_category signal for category {i}: {category}")
-                
-                # Small delay between reveals for visual effect
-                await asyncio.sleep(1.5)
+                category_tasks.append(asyncio.create_task(generator.generate_questions_for_category(category)))
+            
+            try:
+                all_category_data = list(await asyncio.gather(*category_tasks))
+            except Exception:
+                # Don't leave the remaining generation tasks running
+                for task in category_tasks:
+                    task.cancel()
+                final_task.cancel()
+                raise
+            
+            # Reveal all categories with one request; the backend paces the reveals
+            logger.info(f"Revealing {len(all_category_data)} categories")
+            loop = asyncio.get_running_loop()
+            success = await self._send_signal_to_frontend("reveal_categories", {
+                "categories": all_category_data,
+                "interval": self.REVEAL_INTERVAL
+            })
+            if success:
+                reveals_done_at = loop.time() + self.REVEAL_INTERVAL * len(all_category_data)
+            else:
+                logger.error("Failed to send reveal_categories signal")
+                reveals_done_at = loop.time()
             
             # Generate the final object
             logger.info("Generating final board data object")
@@ -96,30 +184,28 @@ class BoardManager:
                     {"name": "Player 3", "score": 0}
                 ],
                 "categories": all_category_data,
-                "final": await generator._generate_final_jeopardy()
+                "final": await final_task
             }
             
             # Save the generated board
             file_path = os.path.join("app/game_data", f"{board_name}.json")
             logger.info(f"Saving board to {file_path}")
-            with open(file_path, 'w') as f:
-                json.dump(board_data, f, indent=2)
+            await asyncio.to_thread(_write_board_file, file_path, board_data)
             
             logger.info(f"Board generated at {file_path}")
+            self._last_board_id = board_name
+            
+            # Let the paced reveals finish before switching to the full board
+            await asyncio.sleep(max(0, reveals_done_at - loop.time()))
             
             # Select the generated board
             logger.info(f"Selecting board: {board_name}")
-            success = self._select_board(board_name)
+            success = await self._select_board(board_name)
             if not success:
                 logger.error(f"Failed to select board: {board_name}")
                 return None
             
-            # Mark game as ready to start
-            logger.info("Sending game_ready signal")
-            success = self._send_signal_to_frontend("game_ready", {"ready": True})
-            if not success:
-                logger.error("Failed to send game_ready signal")
-            
+            # The start_board_generation signal already marked the game as ready
             return board_name
             
         except Exception as e:
@@ -128,7 +214,7 @@ class BoardManager:
             logger.error(traceback.format_exc())
             return None
     
-    def _send_signal_to_frontend(self, signal_type, payload=None):
+    async def _send_signal_to_frontend(self, signal_type, payload=None):
         """
         Send a signal to the frontend using HTTP request to backend API.
         
@@ -142,45 +228,58 @@ class BoardManager:
         if payload is None:
             payload = {}
             
-        try:
-            # Determine which endpoint to call based on signal type
-            if signal_type == "start_board_generation":
-                endpoint = f"{self.api_url}/api/board/start-generation"
-                response = requests.post(endpoint, timeout=5)
-            elif signal_type == "reveal_category":
-                endpoint = f"{self.api_url}/api/board/reveal-category"
-                response = requests.post(endpoint, json=payload, timeout=5)
-            elif signal_type == "game_ready":
-                # Use the game_service directly since there's no specific endpoint for this yet
-                endpoint = f"{self.api_url}/api/board/start-generation"  # This also sets game_ready flag
-                response = requests.post(endpoint, timeout=5)
-            else:
-                logger.error(f"Unknown signal type: {signal_type}")
-                return False
-            
-            # Check response
-            if response.status_code == 200:
-                logger.info(f"Successfully sent {signal_type} signal via API: {response.json()}")
-                
-                # Take screenshot for debugging
-                try:
-                    from ..browser.selenium_utils import BrowserUtils
-                    BrowserUtils.take_screenshot(self.browser, f"after_signal_{signal_type}")
-                except Exception as e:
-                    logger.error(f"Error taking screenshot: {e}")
+        # Determine which endpoint to call based on signal type
+        endpoint, send_payload = self._signal_urls.get(signal_type, (None, False))
+        if endpoint is None:
+            logger.error(f"Unknown signal type: {signal_type}")
+            return False
+        
+        body = payload if send_payload else None
+        
+        for attempt in range(1, self.SIGNAL_MAX_ATTEMPTS + 1):
+            try:
+                async with self._get_session().post(endpoint, json=body) as response:
+                    # Check response
+                    if response.status == 200:
+                        await _log_api_success(response, f"Successfully sent {signal_type} signal via API")
+                        
+                        # Take screenshot for debugging
+                        if DEBUG_SCREENSHOTS:
+                            try:
+                                from ..browser.selenium_utils import BrowserUtils
+                                BrowserUtils.take_screenshot(self.browser, f"after_signal_{signal_type}")
+                            except Exception as e:
+                                logger.error(f"Error taking screenshot: {e}")
+                            
+                        return True
                     
-                return True
-            else:
-                logger.error(f"API request failed for {signal_type}: {response.status_code} - {response.text}")
+                    error_text = await response.text()
+                    if response.status < 500:
+                        # Client errors won't succeed on a retry
+                        logger.error(f"API request failed for {signal_type}: {response.status} - {error_text}")
+                        return False
+                    
+                    logger.warning(f"API request failed for {signal_type}: {response.status} - {error_text} "
+                                   f"(attempt {attempt}/{self.SIGNAL_MAX_ATTEMPTS})")
+                    
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                # Transient transport errors are worth retrying
+                logger.warning(f"Error sending {signal_type} signal via API: {e} "
+                               f"(attempt {attempt}/{self.SIGNAL_MAX_ATTEMPTS})")
+            except Exception as e:
+                logger.error(f"Error sending signal to frontend via API: {e}")
+                import traceback
+                logger.error(traceback.format_exc())
                 return False
-                
-        except Exception as e:
-            logger.error(f"Error sending signal to frontend via API: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
-            return False
+            
+            # Exponential backoff before the next attempt
+            if attempt < self.SIGNAL_MAX_ATTEMPTS:
+                await asyncio.sleep(min(self.SIGNAL_RETRY_MAX_DELAY, self.SIGNAL_RETRY_BASE_DELAY * 2 ** (attempt - 1)))
+        
+        logger.error(f"Giving up on {signal_type} signal after {self.SIGNAL_MAX_ATTEMPTS} attempts")
+        return False
     
-    def _select_board(self, board_id):
+    async def _select_board(self, board_id):
         """
         Select a board through the backend API.
         
@@ -192,18 +291,17 @@ class BoardManager:
         """
         try:
             # Call the API to select the board
-            endpoint = f"{self.api_url}/api/board/select-board"
+            endpoint = self._url_select_board
             payload = {"boardId": board_id}
             
             logger.info(f"Sending API request to select board: {board_id}")
-            response = requests.post(endpoint, json=payload, timeout=5)
-            
-            if response.status_code == 200:
-                logger.info(f"Successfully selected board via API: {response.json()}")
-                return True
-            else:
-                logger.error(f"API request failed: {response.status_code} - {response.text}")
-                return False
+            async with self._get_session().post(endpoint, json=payload) as response:
+                if response.status == 200:
+                    await _log_api_success(response, f"Successfully selected board via API: {board_id}")
+                    return True
+                else:
+                    logger.error(f"API request failed: {response.status} - {await response.text()}")
+                    return False
         except Exception as e:
             logger.error(f"Error selecting board via API: {e}")
             return False
@@ -217,8 +315,7 @@ class BoardManager:
         """
         try:
             # Find available boards
-            from selenium.webdriver.common.by import By
-            board_options = self.browser.find_elements(By.CLASS_NAME, "board-option")
+            board_options = self.browser.find_elements(*_BOARD_OPTION_LOCATOR)
             if board_options:
                 # Click the first board option
                 board_options[0].click()
@@ -241,61 +338,35 @@ class BoardManager:
         try:
             logger.info("Selecting a random $200 clue to start the game")
             
-            # Try to find the board ID (based on the most recent generated board)
-            board_id = None
-            try:
-                import os
-                import glob
-                
-                # Look for generated board files
-                board_files = glob.glob("app/game_data/generated_*.json")
-                if board_files:
-                    # Get the most recent file
-                    latest_board = max(board_files, key=os.path.getctime)
-                    board_id = os.path.basename(latest_board).replace(".json", "")
-                    logger.info(f"Found most recent board ID: {board_id}")
-            except Exception as e:
-                logger.warning(f"Error finding board ID: {e}")
+            # Use the board this manager generated most recently, if any
+            board_id = self._last_board_id
             
             # Give the board time to fully render all categories
-            from selenium.webdriver.common.by import By
-            from ..browser.selenium_utils import BrowserUtils
+            from selenium.common.exceptions import TimeoutException
+            from selenium.webdriver.support.ui import WebDriverWait
             
-            attempts = 0
-            max_attempts = 3
-            categories_with_200 = []
+            def find_categories_with_200(driver):
+                # We should have at least 3 categories with $200 clues once the board is populated
+                categories = driver.execute_script(_CATEGORIES_WITH_200_SCRIPT) or []
+                return categories if len(categories) >= 3 else False
             
-            while attempts < max_attempts:
-                # Get category elements
-                category_elements = self.browser.find_elements(By.CSS_SELECTOR, ".jeopardy-board .category")
-                
-                # Build list of categories with $200 clues
-                categories_with_200 = []
-                for i, category_element in enumerate(category_elements):
-                    title_element = category_element.find_element(By.CSS_SELECTOR, ".category-title")
-                    category_name = title_element.text.strip()
-                    
-                    # Check if this category has a $200 clue
-                    questions = category_element.find_elements(By.CSS_SELECTOR, ".question:not(.used)")
-                    for question in questions:
-                        if question.text.strip() == "$200":
-                            categories_with_200.append({
-                                "index": i,
-                                "name": category_name
-                            })
-                            break
-                
-                if len(categories_with_200) >= 3:  # We should have at least 3 categories with $200 clues
-                    logger.info(f"Found {len(categories_with_200)} categories with $200 clues after {attempts+1} attempts")
-                    break
-                    
-                # Not enough categories with $200 clues, wait and try again
-                logger.info(f"Only found {len(categories_with_200)} categories with $200 clues, waiting for board to fully populate (attempt {attempts+1}/{max_attempts})")
-                attempts += 1
-                await asyncio.sleep(2)  # Wait 2 seconds for more categories to load
+            try:
+                # Wait (off the event loop) until the board is populated rather than sleeping blindly
+                categories_with_200 = await asyncio.to_thread(
+                    WebDriverWait(self.browser, 6, poll_frequency=0.25).until, find_categories_with_200
+                )
+                logger.info(f"Found {len(categories_with_200)} categories with $200 clues")
+            except TimeoutException:
+                # Use whatever is available after waiting
+                categories_with_200 = await asyncio.to_thread(
+                    self.browser.execute_script, _CATEGORIES_WITH_200_SCRIPT
+                ) or []
+                logger.info(f"Only found {len(categories_with_200)} categories with $200 clues after waiting for board to fully populate")
                 
                 # Take screenshot for debugging
-                BrowserUtils.take_screenshot(self.browser, f"waiting_for_board_{attempts}")
+                if DEBUG_SCREENSHOTS:
+                    from ..browser.selenium_utils import BrowserUtils
+                    await asyncio.to_thread(BrowserUtils.take_screenshot, self.browser, "waiting_for_board")
             
             if not categories_with_200:
                 logger.warning("No categories with $200 clues available after waiting")
@@ -311,7 +382,7 @@ class BoardManager:
             
             # Use the API to select the question
             try:
-                endpoint = f"{self.api_url}/api/board/select-question"
+                endpoint = self._url_select_question
                 payload = {
                     "categoryIndex": category_index,
                     "valueIndex": 0  # $200 is always the first question (index 0)
@@ -323,14 +394,13 @@ class BoardManager:
                     logger.info(f"Including board ID in request: {board_id}")
                 
                 logger.info(f"Sending API request to select question: categoryIndex={category_index}, valueIndex=0")
-                response = requests.post(endpoint, json=payload, timeout=5)
-                
-                if response.status_code == 200:
-                    logger.info(f"Successfully selected question via API: {response.json()}")
-                    return True
-                else:
-                    logger.error(f"API request failed: {response.status_code} - {response.text}")
-                    return False
+                async with self._get_session().post(endpoint, json=payload) as response:
+                    if response.status == 200:
+                        await _log_api_success(response, "Successfully selected question via API")
+                        return True
+                    else:
+                        logger.error(f"API request failed: {response.status} - {await response.text()}")
+                        return False
             except Exception as e:
                 logger.error(f"Error sending API request: {e}")
                 return False
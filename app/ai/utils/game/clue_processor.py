@@ -7,24 +7,122 @@ related to the question-answer flow in the Jeopardy game.
 
 import logging
 import json
+import os
+import traceback
 import asyncio
 import time
-import requests
+from collections import OrderedDict
+import aiohttp
+import orjson
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
 from typing import List, Dict, Set, Optional
 
 from ..browser.selenium_utils import BrowserUtils
 
 logger = logging.getLogger(__name__)
 
+# Directory holding the generated board files
+GAME_DATA_DIR = "app/game_data"
+
+# Debug screenshots are slow WebDriver round-trips, so only take them when asked to
+DEBUG_SCREENSHOTS = os.environ.get("JEOPARDY_DEBUG_SCREENSHOTS") == "1"
+
+# Returns [question text, title] of the open question modal, or null if none is open
+_QUESTION_MODAL_SCRIPT = """
+const modal = document.querySelector('.modal-content');
+if (!modal) return null;
+const question = modal.querySelector('.question-text');
+const title = modal.querySelector('h2');
+return [question ? question.innerText : null, title ? title.innerText : null];
+"""
+
+# Elements that may show the correct answer, in priority order
+_ANSWER_SELECTORS = (".question-answer", ".admin-controls .question-answer", ".admin-controls p")
+
+# Status lines shown alongside the answer that aren't the answer itself
+_SKIP_PREFIXES = ("Player:", "Bet:", "Player buzzed in:")
+
+# Returns the first answer text (arguments[0] selectors, skipping text starting with
+# any of arguments[1]) trying the selectors in order, or null if none is shown
+_CORRECT_ANSWER_SCRIPT = """
+const [selectors, skip] = arguments;
+for (const selector of selectors) {
+    for (const el of document.querySelectorAll(selector)) {
+        const text = (el.innerText || '').trim();
+        if (text && !skip.some(prefix => text.startsWith(prefix))) {
+            return text;
+        }
+    }
+}
+return null;
+"""
+
+# Translation table deleting the '$' and ',' from displayed dollar values
+_STRIP_VALUE_CHARS = str.maketrans("", "", "$,")
+
+# Board display text for the standard single and double round clue values
+_VALUE_FMTS = {v: f"${v:,}" if v >= 1000 else f"${v}" for v in (200, 400, 600, 800, 1000, 1200, 1600, 2000)}
+
+# Maximum number of cached LLM evaluations per cache
+EVALUATION_CACHE_SIZE = 2048
+
+def _normalize_text(text):
+    """Normalize free text for use in a cache key (case and whitespace insensitive)."""
+    return " ".join(str(text).lower().split())
+
+def _cache_get(cache, key):
+    """Get a value from an LRU cache, marking it as recently used."""
+    value = cache.get(key)
+    if value is not None:
+        cache.move_to_end(key)
+    return value
+
+def _cache_put(cache, key, value):
+    """Store a value in an LRU cache, evicting the least recently used entry when full."""
+    cache[key] = value
+    cache.move_to_end(key)
+    if len(cache) > EVALUATION_CACHE_SIZE:
+        cache.popitem(last=False)
+
+# Returns each board category's title, position and unused clues (text, board position
+# and element) in one call
+_BOARD_SNAPSHOT_SCRIPT = """
+return Array.from(document.querySelectorAll('.jeopardy-board .category')).map((category, ci) => {
+    const title = category.querySelector('.category-title');
+    const clues = [];
+    category.querySelectorAll('.question').forEach((question, vi) => {
+        if (!question.classList.contains('used')) {
+            clues.push({text: question.innerText.trim(), index: vi, element: question});
+        }
+    });
+    return {name: title ? title.innerText.trim() : '', index: ci, element: category, clues: clues};
+});
+"""
+
+def _index_clues(clues):
+    """Map each clue text to the first clue showing it."""
+    index = {}
+    for clue in clues:
+        index.setdefault(clue["text"], clue)
+    return index
+
 class ClueProcessor:
     """
     Handles the processing of clues, including selection, answer evaluation,
     and managing question state.
     """
     
+    # Prompt templates rendered on every clue selection and answer evaluation
+    PROMPT_TEMPLATES = (
+        "clue_selection_prompt.j2",
+        "clue_selection_evaluation.j2",
+        "answer_evaluation_prompt.j2",
+        "answer_evaluation.j2",
+    )
+    
     def __init__(self, browser=None, game_state=None, llm_client=None, llm_config=None):
         """
         Initialize the clue processor.
@@ -40,9 +138,55 @@ class ClueProcessor:
         self.llm_client = llm_client
         self.llm_config = llm_config
         
+        # Compile the prompt templates up front so the first selection doesn't pay for it
+        if llm_client is not None:
+            for template_name in self.PROMPT_TEMPLATES:
+                try:
+                    llm_client.prompt_manager.get_template(template_name)
+                except Exception as e:
+                    logger.warning(f"Could not preload template {template_name}: {e}")
+        
         # Question state flags
         self.question_audio_played = False
         self.buzzer_enabled = False
+        
+        # Snapshot of the board's categories and unused clues, reused until the board changes
+        self._board_snapshot = None
+        self._board_snapshot_by_name = {}
+        
+        # Category/value index maps built from generated board files, keyed by board ID
+        self._board_index_cache = {}
+        
+        # LLM verdicts for answers and clue selections, keyed by normalized input
+        self._evaluation_cache = OrderedDict()
+        self._selection_cache = OrderedDict()
+        
+        # Most recent generated board ID, valid while the game data directory's mtime is unchanged
+        self._latest_board_id = None
+        self._latest_board_mtime = None
+        
+        # Screenshots are only taken when debugging
+        self._debug_screens = DEBUG_SCREENSHOTS or logger.isEnabledFor(logging.DEBUG)
+        
+        # Question text and title of the last question modal seen by monitor_current_question
+        self._last_modal_sig = None
+        
+        # Keep-alive HTTP session for backend API calls, created on first use
+        self._http = None
+    
+    def _get_session(self):
+        """
+        Get the HTTP session for backend API calls, creating it if needed.
+        
+        Returns:
+            aiohttp ClientSession reused across API calls
+        """
+        if self._http is None or self._http.closed:
+            self._http = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=4),
+                timeout=aiohttp.ClientTimeout(total=5)
+            )
+        return self._http
     
     async def process_clue_selection(self, message):
         """
@@ -73,20 +217,31 @@ class ClueProcessor:
                 "available_categories": available_categories
             }
             
-            # Log full context for debugging
-            logger.info(f"Sending clue selection context to LLM: {json.dumps(user_context, indent=2)}")
-            
-            # Use LLM to evaluate the clue selection
-            response_text = await self.llm_client.chat_with_template(
-                user_template="clue_selection_prompt.j2",
-                user_context=user_context,
-                system_template="clue_selection_evaluation.j2",
-                config=self.llm_config
+            # Reuse the evaluation of an identical message against the same board
+            cache_key = (
+                tuple((cat["name"], tuple(cat["available_values"])) for cat in available_categories),
+                _normalize_text(message)
             )
+            response = _cache_get(self._selection_cache, cache_key)
             
             try:
-                response = json.loads(response_text)
-                logger.info(f"LLM evaluated clue selection: {json.dumps(response, indent=2)}")
+                if response is not None:
+                    logger.info(f"Reusing cached clue selection evaluation: {response}")
+                else:
+                    # Log full context for debugging
+                    logger.info(f"Sending clue selection context to LLM: {json.dumps(user_context, indent=2)}")
+                    
+                    # Use LLM to evaluate the clue selection
+                    response_text = await self.llm_client.chat_with_template(
+                        user_template="clue_selection_prompt.j2",
+                        user_context=user_context,
+                        system_template="clue_selection_evaluation.j2",
+                        config=self.llm_config
+                    )
+                    
+                    response = orjson.loads(response_text)
+                    logger.info(f"LLM evaluated clue selection: {json.dumps(response, indent=2)}")
+                    _cache_put(self._selection_cache, cache_key, response)
                 
                 if not response.get("valid", False):
                     error_msg = response.get('error', 'Unknown error')
@@ -106,16 +261,84 @@ class ClueProcessor:
                 # Find and click the clue on the board
                 return await self._select_clue_on_board(category_name, value)
                 
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 logger.error(f"Failed to parse LLM response as JSON: {response_text}")
                 return False
                 
         except Exception as e:
             logger.error(f"Error processing clue selection: {e}")
-            import traceback
             logger.error(traceback.format_exc())
             return False
     
+    async def _debug_screenshot(self, name):
+        """
+        Take a debug screenshot in a worker thread, if debug screenshots are enabled.
+        
+        Args:
+            name: Name for the screenshot file
+        """
+        if self._debug_screens:
+            await asyncio.to_thread(BrowserUtils.take_screenshot, self.browser, name)
+    
+    def _snapshot_board(self):
+        """
+        Read the board's categories and unused clues, reusing the previous read
+        until the board changes.
+        
+        Returns:
+            List of dictionaries with the category 'index', 'name', 'name_lower',
+            'element', its unused 'clues' (each with 'text', board 'index' and
+            'element') and 'clue_index' mapping clue text to its clue
+        """
+        if self._board_snapshot is not None:
+            return self._board_snapshot
+        
+        # Read every category title and unused clue in a single browser round-trip
+        categories = self.browser.execute_script(_BOARD_SNAPSHOT_SCRIPT) or []
+        
+        snapshot = [
+            {
+                "index": category["index"],
+                "name": category["name"],
+                "name_lower": category["name"].lower(),
+                "element": category["element"],
+                "clues": category["clues"],
+                "clue_index": _index_clues(category["clues"])
+            }
+            for category in categories
+        ]
+        
+        self._board_snapshot = snapshot
+        self._board_snapshot_by_name = {category["name_lower"]: category for category in snapshot}
+        return snapshot
+    
+    def _invalidate_board_snapshot(self):
+        """Drop the cached board snapshot so the next read sees the current board."""
+        self._board_snapshot = None
+        self._board_snapshot_by_name = {}
+    
+    def _find_snapshot_category(self, category_name):
+        """
+        Find a category in the board snapshot by name (case-insensitive, then by containment).
+        
+        Args:
+            category_name: The name of the category
+            
+        Returns:
+            The snapshot category dictionary, or None if no category matches
+        """
+        snapshot = self._snapshot_board()
+        target = category_name.lower()
+        
+        category = self._board_snapshot_by_name.get(target)
+        if category is None:
+            category = next(
+                (c for c in snapshot
+                 if c["name_lower"] and (target in c["name_lower"] or c["name_lower"] in target)),
+                None
+            )
+        return category
+    
     def _get_available_categories(self):
         """
         Get available categories and clues from the board.
@@ -126,34 +349,25 @@ class ClueProcessor:
         try:
             available_categories = []
             
-            # Find all category elements
-            category_elements = self.browser.find_elements(By.CSS_SELECTOR, ".jeopardy-board .category")
-            
-            for category_element in category_elements:
-                # Get the category title
-                title_element = category_element.find_element(By.CSS_SELECTOR, ".category-title")
-                category_name = title_element.text.strip()
+            for category in self._snapshot_board():
+                category_name = category["name"]
                 if not category_name:
                     continue
                 
-                logger.info(f"Found category: {category_name}")
+                logger.debug("Found category: %s", category_name)
                 
                 # Get all clues that are not used
                 available_values = []
                 
-                # Use direct selenium queries to find all questions that don't have the "used" class
-                question_elements = category_element.find_elements(By.CSS_SELECTOR, ".question:not(.used)")
-                
-                for question_element in question_elements:
-                    value_text = question_element.text.strip()
+                for clue in category["clues"]:
+                    value_text = clue["text"]
                     # Extract numeric value (remove $ and commas)
-                    value_str = value_text.replace("$", "").replace(",", "")
                     try:
-                        value = int(value_str)
+                        value = int(value_text.translate(_STRIP_VALUE_CHARS))
                         available_values.append(value)
-                        logger.info(f"  Available clue: ${value}")
+                        logger.debug("  Available clue: $%d", value)
                     except ValueError:
-                        logger.warning(f"  Couldn't parse value from '{value_text}'")
+                        logger.warning("  Couldn't parse value from '%s'", value_text)
                 
                 if available_values:
                     available_categories.append({
@@ -161,15 +375,143 @@ class ClueProcessor:
                         "available_values": available_values
                     })
             
-            logger.info(f"Found {len(available_categories)} categories with available clues")
+            logger.info(
+                "Board snapshot: %d categories, %d clues available",
+                len(available_categories),
+                sum(len(cat["available_values"]) for cat in available_categories)
+            )
             return available_categories
             
         except Exception as e:
-            logger.error(f"Error getting available categories: {e}")
-            import traceback
+            logger.error("Error getting available categories: %s", e)
             logger.error(traceback.format_exc())
             return []
     
+    def _find_latest_board_id(self):
+        """
+        Find the ID of the most recently generated board.
+        
+        The result is cached and only recomputed when the game data directory's
+        modification time changes, i.e. when a board file is added or removed.
+        
+        Returns:
+            The board ID, or None if no generated board was found
+        """
+        try:
+            dir_mtime = os.stat(GAME_DATA_DIR).st_mtime
+            if dir_mtime == self._latest_board_mtime:
+                return self._latest_board_id
+            
+            # Look for generated board files; scandir entries carry their stat info
+            with os.scandir(GAME_DATA_DIR) as entries:
+                board_files = [
+                    (entry.stat().st_ctime, entry.name) for entry in entries
+                    if entry.name.startswith("generated_") and entry.name.endswith(".json")
+                ]
+            
+            # Get the most recent file
+            board_id = None
+            if board_files:
+                _, latest_board = max(board_files)
+                board_id = latest_board[:-len(".json")]
+                logger.info(f"Found most recent board ID: {board_id}")
+            
+            self._latest_board_mtime = dir_mtime
+            self._latest_board_id = board_id
+            return board_id
+        except Exception as e:
+            logger.warning(f"Error finding board ID: {e}")
+        return None
+    
+    def _get_board_index(self, board_id):
+        """
+        Get the category/value index map for a generated board, loading it once per board.
+        
+        Args:
+            board_id: ID of the generated board
+            
+        Returns:
+            Dictionary mapping lowercased category name to (category index, {value: value index})
+        """
+        board_index = self._board_index_cache.get(board_id)
+        if board_index is None:
+            with open(os.path.join(GAME_DATA_DIR, f"{board_id}.json"), "r") as f:
+                board_data = json.load(f)
+            
+            board_index = {
+                category["name"].lower(): (
+                    category_index,
+                    {question["value"]: value_index for value_index, question in enumerate(category["questions"])}
+                )
+                for category_index, category in enumerate(board_data.get("categories") or [])
+            }
+            self._board_index_cache[board_id] = board_index
+        return board_index
+    
+    def _lookup_clue_indices(self, board_id, category_name, value):
+        """
+        Look up the board coordinates of a clue from the generated board data.
+        
+        Args:
+            board_id: ID of the generated board
+            category_name: The name of the category
+            value: The dollar value of the clue
+            
+        Returns:
+            Tuple of (category_index, value_index), or None if the clue isn't known
+        """
+        board_index = self._get_board_index(board_id)
+        target = category_name.lower()
+        
+        entry = board_index.get(target)
+        if entry is None:
+            # Fall back to the same loose matching used on the board
+            entry = next(
+                (e for name, e in board_index.items() if target in name or name in target),
+                None
+            )
+        if entry is None:
+            return None
+        
+        category_index, value_indices = entry
+        value_index = value_indices.get(value)
+        if value_index is None:
+            return None
+        return category_index, value_index
+    
+    async def _post_select_question(self, category_index, value_index, board_id):
+        """
+        Ask the backend API to open a question by its board coordinates.
+        
+        Args:
+            category_index: Index of the category on the board
+            value_index: Index of the clue within the category
+            board_id: Optional ID of the board the indices refer to
+            
+        Returns:
+            True if the backend selected the question, False otherwise
+        """
+        try:
+            endpoint = "http://localhost:8000/api/board/select-question"
+            payload = {
+                "categoryIndex": category_index,
+                "valueIndex": value_index
+            }
+            
+            # Add board ID if available
+            if board_id:
+                payload["boardId"] = board_id
+            
+            async with self._get_session().post(endpoint, json=payload) as response:
+                if response.status == 200:
+                    logger.info(f"Successfully selected question via API: {await response.json()}")
+                    return True
+                else:
+                    logger.error(f"API request failed: {response.status} - {await response.text()}")
+        except Exception as e:
+            logger.error(f"Error sending API request: {e}")
+        return False
+    
     async def _select_clue_on_board(self, category_name, value):
         """
         Select and click a clue on the board.
@@ -182,125 +524,99 @@ class ClueProcessor:
             True if successfully selected, False otherwise
         """
         try:
-            logger.info(f"Selecting clue: {category_name} for ${value}")
+            logger.info("Selecting clue: %s for $%s", category_name, value)
             
             # Format value for matching (add $ and commas for larger values)
-            value_text = f"${value:,}" if value >= 1000 else f"${value}"
+            value_text = _VALUE_FMTS.get(value) or (f"${value:,}" if value >= 1000 else f"${value}")
             
             # Take screenshot before attempting to click
-            BrowserUtils.take_screenshot(self.browser, "before_select_clue")
+            await self._debug_screenshot("before_select_clue")
             
             # Try to find the board ID (based on the most recent generated board)
-            board_id = None
-            try:
-                import os
-                import glob
-                
-                # Look for generated board files
-                board_files = glob.glob("app/game_data/generated_*.json")
-                if board_files:
-                    # Get the most recent file
-                    latest_board = max(board_files, key=os.path.getctime)
-                    board_id = os.path.basename(latest_board).replace(".json", "")
-                    logger.info(f"Found most recent board ID: {board_id}")
-            except Exception as e:
-                logger.warning(f"Error finding board ID: {e}")
-            
-            # First find the category div that contains our target category title
-            category_elements = self.browser.find_elements(By.CSS_SELECTOR, ".jeopardy-board .category")
-            target_category = None
-            category_index = -1
-            
-            # Loop through all categories to find the matching one
-            for i, category_element in enumerate(category_elements):
-                title_element = category_element.find_element(By.CSS_SELECTOR, ".category-title")
-                current_category_name = title_element.text.strip()
-                
-                # Check if this is our target category (case-insensitive and contains comparison)
-                if (current_category_name.lower() == category_name.lower() or 
-                    category_name.lower() in current_category_name.lower() or
-                    current_category_name.lower() in category_name.lower()):
-                    target_category = category_element
-                    category_index = i
-                    logger.info(f"Found matching category: {current_category_name} at index {category_index}")
-                    break
+            board_id = self._find_latest_board_id()
             
+            # Fast path: look the clue up in the generated board data and select it through
+            # the backend API without touching the DOM
+            api_attempted = False
+            if board_id:
+                try:
+                    indices = self._lookup_clue_indices(board_id, category_name, value)
+                except Exception as e:
+                    logger.warning("Error reading board index for %s: %s", board_id, e)
+                    indices = None
+                
+                if indices:
+                    category_index, value_index = indices
+                    logger.info("Using backend API to select question (c:%d, v:%d, board:%s)", category_index, value_index, board_id)
+                    api_attempted = True
+                    if await self._post_select_question(category_index, value_index, board_id):
+                        self._invalidate_board_snapshot()
+                        # No need to click the clue, the API has handled it
+                        await self._debug_screenshot("after_api_select")
+                        return True
+            
+            # First find the category that matches our target category title, using
+            # the board snapshot taken when the available categories were read
+            target_category = self._find_snapshot_category(category_name)
             if not target_category:
-                logger.warning(f"Category '{category_name}' not found on the board")
+                logger.warning("Category '%s' not found on the board", category_name)
                 return False
             
+            category_index = target_category["index"]
+            logger.debug("Found matching category: %s at index %d", target_category["name"], category_index)
+            
             # Now look for the specific clue value in this category
-            clues = target_category.find_elements(By.CSS_SELECTOR, ".question:not(.used)")
-            target_clue = None
-            value_index = -1
+            target = target_category["clue_index"].get(value_text)
+            if target is None:
+                logger.warning("No available $%s clue found in category '%s'", value, category_name)
+                return False
             
-            # Map dollar values to their typically expected indices
-            value_to_index = {200: 0, 400: 1, 600: 2, 800: 3, 1000: 4}
-            expected_value_index = value_to_index.get(value, -1)
+            value_index = target["index"]
+            logger.debug("Found matching clue: %s at index %d", value_text, value_index)
             
-            for i, clue in enumerate(clues):
-                clue_text = clue.text.strip()
-                logger.info(f"Checking clue text: '{clue_text}' against target: '{value_text}'")
-                
-                if clue_text == value_text:
-                    target_clue = clue
-                    value_index = i
-                    logger.info(f"Found matching clue: {clue_text} at index {value_index}")
-                    break
-            
-            if not target_clue:
-                logger.warning(f"No available ${value} clue found in category '{category_name}'")
-                return False
-                
-            # Use the backend API to select the question
-            logger.info(f"Using backend API to select question (c:{category_index}, v:{value_index}, board:{board_id})")
+            # The selected clue is about to be used, so the next read needs a fresh snapshot
+            self._invalidate_board_snapshot()
             
-            # Send HTTP request to backend API to select the question
-            try:
-                endpoint = "http://localhost:8000/api/board/select-question"
-                payload = {
-                    "categoryIndex": category_index,
-                    "valueIndex": value_index
-                }
-                
-                # Add board ID if available
-                if board_id:
-                    payload["boardId"] = board_id
-                
-                response = requests.post(endpoint, json=payload, timeout=5)
-                
-                if response.status_code == 200:
-                    logger.info(f"Successfully selected question via API: {response.json()}")
+            # Use the backend API with the board positions if the fast path didn't try it
+            if not api_attempted:
+                logger.info("Using backend API to select question (c:%d, v:%d, board:%s)", category_index, value_index, board_id)
+                if await self._post_select_question(category_index, value_index, board_id):
                     # No need to click the clue, the API has handled it
-                    BrowserUtils.take_screenshot(self.browser, "after_api_select")
+                    await self._debug_screenshot("after_api_select")
                     return True
-                else:
-                    logger.error(f"API request failed: {response.status_code} - {response.text}")
-            except Exception as e:
-                logger.error(f"Error sending API request: {e}")
-                # If API fails, fall back to clicking
-                logger.warning("API request failed, falling back to direct click")
             
             # Click the clue as a fallback if API didn't work
+            logger.warning("API request failed, falling back to direct click")
             logger.info("Clicking on clue element as fallback")
             
-            # Wait a moment before clicking to ensure UI is stable
-            await asyncio.sleep(0.5)
+            # Look the cell up by its board position, falling back to the snapshot's
+            # element handle for boards rendered without position attributes
+            cells = self.browser.find_elements(
+                By.CSS_SELECTOR,
+                f'.question[data-cat-idx="{category_index}"][data-val-idx="{value_index}"]'
+            )
+            target_clue = cells[0] if cells else target["element"]
             
-            # Scroll to make sure the clue is visible
+            # Scroll to make sure the clue is visible, then wait only as long as it
+            # takes for the clue to become clickable
             self.browser.execute_script("arguments[0].scrollIntoView({block: 'center'});", target_clue)
-            await asyncio.sleep(0.5)  # Give time for scrolling
+            try:
+                await asyncio.to_thread(
+                    WebDriverWait(self.browser, 2, poll_frequency=0.05).until,
+                    EC.element_to_be_clickable(target_clue)
+                )
+            except TimeoutException:
+                logger.warning("Clue did not become clickable in time, clicking anyway")
             
             # Click the clue
             self.browser.execute_script("arguments[0].click();", target_clue)
             
             # Take screenshot after clicking
-            BrowserUtils.take_screenshot(self.browser, "after_select_clue")
+            await self._debug_screenshot("after_select_clue")
             return True
                 
         except Exception as e:
-            logger.error(f"Error selecting clue on board: {e}")
-            import traceback
+            logger.error("Error selecting clue on board: %s", e)
             logger.error(traceback.format_exc())
             return False
     
@@ -312,11 +628,18 @@ class ClueProcessor:
             True if a new question was detected and processed, False otherwise
         """
         try:
-            question_elements = self.browser.find_elements(By.CSS_SELECTOR, ".modal-content .question-text")
-            if not question_elements:
+            # Read the modal's question text and title in one round-trip
+            sig = self.browser.execute_script(_QUESTION_MODAL_SCRIPT)
+            if not sig or not sig[0]:
+                self._last_modal_sig = None
                 return False
-                
-            question_text = question_elements[0].text.strip()
+            
+            # Nothing to do while the same modal stays open
+            if sig == self._last_modal_sig and self.game_state.current_question:
+                return False
+            self._last_modal_sig = sig
+            
+            question_text = sig[0].strip()
             if not question_text:
                 return False
                 
@@ -324,21 +647,23 @@ class ClueProcessor:
             if (not self.game_state.current_question or 
                 self.game_state.current_question.text != question_text):
                 
-                logger.info(f"New question detected: {question_text}")
+                logger.info("New question detected: %s", question_text)
                 
                 # Reset question-related flags
                 self.question_audio_played = False
                 self.buzzer_enabled = False
                 
+                # Opening a question changes the board
+                self._invalidate_board_snapshot()
+                
                 # Extract category and value
-                title_elements = self.browser.find_elements(By.CSS_SELECTOR, ".modal-content h2")
-                title_text = title_elements[0].text.strip() if title_elements else ""
+                title_text = (sig[1] or "").strip()
                 
                 try:
-                    if " - $" in title_text:
-                        parts = title_text.split(" - $")
-                        category = parts[0].strip()
-                        value = int(parts[1].strip().replace(",", ""))
+                    category, sep, value_text = title_text.partition(" - $")
+                    if sep:
+                        category = category.strip()
+                        value = int(value_text.translate(_STRIP_VALUE_CHARS))
                     else:
                         category = "Unknown"
                         value = 0
@@ -346,36 +671,24 @@ class ClueProcessor:
                     category = "Unknown"
                     value = 0
                 
-                # Get correct answer if available
-                correct_answer = None
-                selectors = [
-                    ".question-answer",
-                    ".admin-controls .question-answer",
-                    ".admin-controls p"
-                ]
-                
-                for selector in selectors:
-                    elements = self.browser.find_elements(By.CSS_SELECTOR, selector)
-                    for element in elements:
-                        text = element.text.strip()
-                        if text and not text.startswith(("Player:", "Bet:", "Player buzzed in:")):
-                            correct_answer = text
-                            logger.info(f"Found answer with {selector}: {correct_answer}")
-                            break
-                    if correct_answer:
-                        break
+                # Get correct answer if available (one browser round-trip for all selectors)
+                correct_answer = self.browser.execute_script(
+                    _CORRECT_ANSWER_SCRIPT, list(_ANSWER_SELECTORS), list(_SKIP_PREFIXES)
+                )
+                if correct_answer:
+                    logger.debug("Found answer: %s", correct_answer)
                 
                 # Update game state
                 self.game_state.set_question(question_text, correct_answer, category, value)
                 
                 # Take a screenshot for debugging
-                BrowserUtils.take_screenshot(self.browser, "question_detected")
+                await self._debug_screenshot("question_detected")
                 return True
             
             return False
             
         except Exception as e:
-            logger.error(f"Error monitoring current question: {e}")
+            logger.error("Error monitoring current question: %s", e)
             return False
     
     async def evaluate_answer(self, player_answer):
@@ -394,6 +707,13 @@ class ClueProcessor:
         question = self.game_state.current_question
         logger.info(f"Evaluating answer: '{player_answer}' against correct answer: '{question.answer}'")
         
+        # The same answer to the same question always gets the same verdict
+        cache_key = (question.text, _normalize_text(player_answer))
+        cached = _cache_get(self._evaluation_cache, cache_key)
+        if cached is not None:
+            logger.info(f"Reusing cached answer evaluation: correct={cached}")
+            return cached
+        
         try:
             # Use template-based approach for the prompt
             user_context = {
@@ -411,12 +731,13 @@ class ClueProcessor:
             )
             
             try:
-                response = json.loads(response_text)
+                response = orjson.loads(response_text)
                 is_correct = response.get("correct", False)
                 explanation = response.get("explanation", "No explanation provided")
                 logger.info(f"LLM evaluation: correct={is_correct}, reason: {explanation}")
+                _cache_put(self._evaluation_cache, cache_key, is_correct)
                 return is_correct
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 logger.error(f"Failed to parse LLM response as JSON: {response_text}")
                 return False
                 
@@ -435,13 +756,13 @@ class ClueProcessor:
             True if successfully marked, False otherwise
         """
         try:
-            BrowserUtils.take_screenshot(self.browser, f"before_mark_{is_correct}")
+            await self._debug_screenshot(f"before_mark_{is_correct}")
             
             # Find and click the appropriate button
             button = BrowserUtils.find_button(self.browser, is_correct)
             if button and BrowserUtils.click_button(self.browser, button):
                 logger.info(f"Successfully marked answer as {'correct' if is_correct else 'incorrect'}")
-                BrowserUtils.take_screenshot(self.browser, f"after_mark_{is_correct}")
+                await self._debug_screenshot(f"after_mark_{is_correct}")
                 return True
             else:
                 logger.warning(f"Could not find {'correct' if is_correct else 'incorrect'} button")
@@ -501,11 +822,11 @@ class ClueProcessor:
             return False
         
         # Calculate how long the buzzer has been active without anyone buzzing in
-        buzzer_age = time.time() - self.game_state.buzzer_start_time
+        buzzer_age = time.monotonic() - self.game_state.buzzer_start_time
         if buzzer_age < 7:  # Less than 7 seconds, not timed out yet
             return False
         
-        logger.info(f"Question timed out after {buzzer_age:.1f} seconds with no buzzer")
+        logger.info("Question timed out after %.1f seconds with no buzzer", buzzer_age)
         
         try:
             # Find and click the dismiss button
@@ -521,6 +842,7 @@ class ClueProcessor:
                 
                 # Reset question state
                 self.game_state.reset_question()
+                self._invalidate_board_snapshot()
                 
                 # Reset tracking flags
                 self.question_audio_played = False
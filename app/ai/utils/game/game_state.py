@@ -3,13 +3,15 @@ Game state management for the AI Host.
 """
 
 import logging
+import sys
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Optional, Set, List
+from typing import Iterable, Optional, Set, List
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Question:
     text: str
     answer: Optional[str]
@@ -17,9 +19,62 @@ class Question:
     value: int
     timestamp: float = 0  # When the question was displayed
 
+def _intern_key(key):
+    """Intern string keys so set lookups of equal keys compare by identity."""
+    return sys.intern(key) if isinstance(key, str) else key
+
+class BoundedSet:
+    """
+    A set that keeps at most maxsize items, evicting the oldest-added item when full.
+    
+    Supports the set operations GameState uses: membership, add, update/|= and clear.
+    """
+    
+    __slots__ = ('maxsize', '_items')
+    
+    def __init__(self, maxsize: int, items: Iterable = ()):
+        self.maxsize = maxsize
+        self._items = OrderedDict()
+        self.update(items)
+    
+    def __contains__(self, item) -> bool:
+        return item in self._items
+    
+    def __iter__(self):
+        return iter(self._items)
+    
+    def __len__(self) -> int:
+        return len(self._items)
+    
+    def keys(self):
+        """Set-like view of the items, usable in set operations (e.g. some_set - bounded.keys())."""
+        return self._items.keys()
+    
+    def add(self, item):
+        """Add an item, marking it as the most recent and evicting the oldest if full."""
+        self._items[item] = None
+        self._items.move_to_end(item)
+        if len(self._items) > self.maxsize:
+            self._items.popitem(last=False)
+    
+    def update(self, items: Iterable):
+        """Add every item from an iterable."""
+        for item in items:
+            self.add(item)
+    
+    def __ior__(self, items: Iterable):
+        self.update(items)
+        return self
+    
+    def clear(self):
+        """Remove all items."""
+        self._items.clear()
+
 class QuestionState:
     """Tracks the state of the current question."""
     
+    __slots__ = ('text', 'answer', 'category', 'value', 'timestamp')
+    
     def __init__(self):
         self.text = ""
         self.answer = ""
@@ -32,6 +87,23 @@ class GameState:
     Tracks the state of the game, including current question, players, etc.
     """
     
+    __slots__ = (
+        'players', 'current_question', 'buzzed_player', 'incorrect_players',
+        'player_with_control', 'expected_player_count',
+        'processed_messages', 'question_processed_messages',
+        'baseline_buzz_messages', 'baseline_control_messages',
+        'game_started', 'welcome_completed', 'waiting_for_preferences',
+        'preference_countdown_started', 'preference_collection_start_time',
+        'preference_countdown_time', 'read_questions', 'preference_check_count',
+        'buzz_timestamp', 'buzzer_start_time',
+        '_should_check_answers', '_should_check_clue'
+    )
+    
+    # Capacity of the processed-message sets (old keys can't reappear once scrolled away)
+    MAX_PROCESSED_MESSAGES = 4096
+    # Capacity of the read-question set (a full game has about 60 clues)
+    MAX_READ_QUESTIONS = 512
+    
     def __init__(self):
         self.players = set()
         self.current_question = None
@@ -41,13 +113,13 @@ class GameState:
         self.expected_player_count = 0
         
         # Message tracking
-        self.processed_messages = set()
-        self.question_processed_messages = set()
+        self.processed_messages = BoundedSet(self.MAX_PROCESSED_MESSAGES)
+        self.question_processed_messages = BoundedSet(self.MAX_PROCESSED_MESSAGES)
         
         # For more reliable message detection - messages when a player buzzed in
-        self.baseline_buzz_messages = set()
+        self.baseline_buzz_messages = frozenset()
         # For more reliable clue selection - messages when a player got control
-        self.baseline_control_messages = set()
+        self.baseline_control_messages = frozenset()
         
         # Game state flags
         self.game_started = False
@@ -58,18 +130,34 @@ class GameState:
         self.preference_countdown_time = 0
         
         # Question tracking
-        self.read_questions = set()
+        self.read_questions = BoundedSet(self.MAX_READ_QUESTIONS)
         
         # Debug counter
         self.preference_check_count = 0
         
         # New field to track when a player buzzed in
         self.buzz_timestamp = 0
+        
+        # When the buzzer was enabled for the current question (time.monotonic() value)
+        self.buzzer_start_time = 0
+        
+        # Polling predicates, recomputed by the mutators that affect them
+        self._should_check_answers = False
+        self._should_check_clue = False
+    
+    def _update_predicates(self):
+        """Recompute the cached polling predicates after a state change."""
+        self._should_check_answers = (self.current_question is not None and 
+                                      self.buzzed_player is not None and 
+                                      self.buzzed_player not in self.incorrect_players)
+        self._should_check_clue = (self.current_question is None and 
+                                   self.game_started and 
+                                   self.player_with_control is not None)
     
     def add_player(self, name: str):
         """Add a player to the game."""
         self.players.add(name)
-        logger.info(f"Added player {name}, current players: {self.players}")
+        logger.info("Added player %s, current players: %s", name, self.players)
     
     def get_player_names(self) -> List[str]:
         """Get a list of all player names."""
@@ -87,7 +175,8 @@ class GameState:
         # Reset per-question state
         self.buzzed_player = None
         self.incorrect_players = set()
-        self.question_processed_messages = set()
+        self.question_processed_messages.clear()
+        self._update_predicates()
     
     def reset_question(self):
         """Reset the current question state."""
@@ -95,7 +184,10 @@ class GameState:
         self.buzzed_player = None
         self.incorrect_players = set()
         self.buzz_timestamp = 0  # Reset the buzz timestamp
+        self.buzzer_start_time = 0
+        self.baseline_buzz_messages = frozenset()  # The buzz baseline only applies to this question
         self.question_processed_messages.clear()  # Clear question-specific processed messages
+        self._update_predicates()
     
     def set_buzzed_player(self, player_name: str, processed_messages: Set[str] = None):
         """
@@ -108,18 +200,27 @@ class GameState:
         self.buzzed_player = player_name
         self.buzz_timestamp = time.time()  # Record when the player buzzed in (keeping for backwards compatibility)
         
-        # Store baseline messages to detect new ones after buzzing
+        # Store baseline messages to detect new ones after buzzing (read-only snapshot)
         if processed_messages:
-            self.baseline_buzz_messages = processed_messages.copy()
-            self.question_processed_messages.update(processed_messages)
+            self.baseline_buzz_messages = frozenset(map(_intern_key, processed_messages))
+            self.question_processed_messages |= self.baseline_buzz_messages
+        
+        self._update_predicates()
+    
+    def set_buzzer_start_time(self):
+        """Record when the buzzer was enabled, using the monotonic clock."""
+        self.buzzer_start_time = time.monotonic()
     
     def reset_buzzed_player(self):
         """Reset the buzzed player without clearing other question state."""
         self.buzzed_player = None
+        self._should_check_answers = False
     
     def track_incorrect_attempt(self, player_name: str):
         """Track a player who attempted to answer incorrectly."""
         self.incorrect_players.add(player_name)
+        if player_name == self.buzzed_player:
+            self._update_predicates()
     
     def all_players_attempted(self) -> bool:
         """Check if all players have attempted to answer the current question."""
@@ -130,24 +231,22 @@ class GameState:
     
     def should_check_answers(self) -> bool:
         """Check if we should be monitoring for player answers."""
-        return (self.current_question is not None and 
-                self.buzzed_player is not None and 
-                self.buzzed_player not in self.incorrect_players)
+        return self._should_check_answers
     
     def should_check_for_clue_selection(self) -> bool:
         """Check if we should be monitoring for clue selection."""
-        return (self.current_question is None and 
-                self.game_started and 
-                self.player_with_control is not None)
+        return self._should_check_clue
     
     def set_player_with_control(self, player_name: str, processed_messages: Set[str] = None):
         """Set the player who has control of the board."""
         self.player_with_control = player_name
         
-        # Store baseline messages to detect new ones after getting control
+        # Store baseline messages to detect new ones after getting control (read-only snapshot)
         if processed_messages:
-            self.baseline_control_messages = processed_messages.copy()
-            self.processed_messages.update(processed_messages)
+            self.baseline_control_messages = frozenset(map(_intern_key, processed_messages))
+            self.processed_messages |= self.baseline_control_messages
+        
+        self._update_predicates()
     
     def get_player_with_control(self) -> Optional[str]:
         """Get the player who has control of the board."""
@@ -159,23 +258,24 @@ class GameState:
     
     def is_message_new(self, message_key: str) -> bool:
         """Check if a message is new (not yet processed)."""
-        return message_key not in self.processed_messages
+        return _intern_key(message_key) not in self.processed_messages
     
     def mark_message_processed(self, message_key: str):
         """Mark a message as processed."""
-        self.processed_messages.add(message_key)
+        self.processed_messages.add(_intern_key(message_key))
     
     def has_question_been_read(self, question_text: str) -> bool:
         """Check if a question has already been read aloud."""
-        return question_text in self.read_questions
+        return _intern_key(question_text) in self.read_questions
     
     def mark_question_read(self, question_text: str):
         """Mark a question as having been read aloud."""
-        self.read_questions.add(question_text)
+        self.read_questions.add(_intern_key(question_text))
     
     def set_game_started(self, started: bool):
         """Set the game started flag."""
         self.game_started = started
+        self._update_predicates()
     
     def is_game_started(self) -> bool:
         """Check if the game has started."""
@@ -196,16 +296,17 @@ class GameState:
         # Initialize the timer when we start waiting
         if waiting and self.preference_collection_start_time == 0:
             self.preference_collection_start_time = time.time()
-            logger.info(f"Started preference collection timer at {self.preference_collection_start_time}")
+            logger.info("Started preference collection timer at %s", self.preference_collection_start_time)
     
     def is_waiting_for_preferences(self) -> bool:
         """Check if we're waiting for player preferences."""
-        # Debug counter to track preference state
-        self.preference_check_count += 1
-        if self.preference_check_count % 10 == 0:  # Log every 10 checks
-            logger.debug(f"waiting_for_preferences={self.waiting_for_preferences}, " +
-                        f"preference_countdown_started={self.preference_countdown_started}, " +
-                        f"collection_time={self.preference_collection_start_time}")
+        # Debug counter to track preference state (only kept while debug logging is on)
+        if logger.isEnabledFor(logging.DEBUG):
+            self.preference_check_count += 1
+            if self.preference_check_count % 10 == 0:  # Log every 10 checks
+                logger.debug("waiting_for_preferences=%s, preference_countdown_started=%s, collection_time=%s",
+                             self.waiting_for_preferences, self.preference_countdown_started,
+                             self.preference_collection_start_time)
         return self.waiting_for_preferences
     
     def is_message_new_after_buzz(self, message_key: str) -> bool:
@@ -218,13 +319,15 @@ class GameState:
         Returns:
             True if the message is new after the buzz, False otherwise
         """
-        # First check if the message was already in our baseline when the player buzzed in
-        if message_key in self.baseline_buzz_messages:
-            # Message was already present when player buzzed in, so it's not a new answer
+        message_key = _intern_key(message_key)
+        
+        # First check if we've already processed this message (the most common hit)
+        if message_key in self.processed_messages or message_key in self.question_processed_messages:
             return False
             
-        # Then check if we've already processed this message
-        if message_key in self.processed_messages or message_key in self.question_processed_messages:
+        # Then check if the message was already in our baseline when the player buzzed in
+        if message_key in self.baseline_buzz_messages:
+            # Message was already present when player buzzed in, so it's not a new answer
             return False
             
         # If it passes both checks, it's a new message after the buzz
@@ -240,13 +343,44 @@ class GameState:
         Returns:
             True if the message is new after control was given, False otherwise
         """
-        # First check if the message was already in our baseline when the player got control
-        if message_key in self.baseline_control_messages:
+        message_key = _intern_key(message_key)
+        
+        # First check if we've already processed this message (the most common hit)
+        if message_key in self.processed_messages:
             return False
             
-        # Then check if we've already processed this message
-        if message_key in self.processed_messages:
+        # Then check if the message was already in our baseline when the player got control
+        if message_key in self.baseline_control_messages:
             return False
             
         # If it passes both checks, it's a new message after control was given
-        return True 
\ No newline at end of file
+        return True
+    
+    def new_messages_after_buzz(self, message_keys: Iterable[str]) -> Set[str]:
+        """
+        Get the messages that are new since the player buzzed in, for a batch of messages.
+        
+        Args:
+            message_keys: Unique identifiers of the messages to check
+            
+        Returns:
+            The keys that are neither in the buzz baseline nor already processed
+        """
+        return (set(message_keys)
+                - self.baseline_buzz_messages
+                - self.processed_messages.keys()
+                - self.question_processed_messages.keys())
+    
+    def new_messages_after_control(self, message_keys: Iterable[str]) -> Set[str]:
+        """
+        Get the messages that are new since a player got control, for a batch of messages.
+        
+        Args:
+            message_keys: Unique identifiers of the messages to check
+            
+        Returns:
+            The keys that are neither in the control baseline nor already processed
+        """
+        return (set(message_keys)
+                - self.baseline_control_messages
+                - self.processed_messages.keys())
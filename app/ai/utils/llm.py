@@ -1,12 +1,22 @@
 import os
-from typing import Dict, List, Optional, Union
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple, Union
 import aiohttp
+import orjson
 import base64
 import logging
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, replace
 
 logger = logging.getLogger(__name__)
 
+# Inworld message roles by OpenAI role (anything that isn't the user is sent as system)
+_ROLE_MAP = {
+    "user": "MESSAGE_ROLE_USER",
+    "system": "MESSAGE_ROLE_SYSTEM",
+    "assistant": "MESSAGE_ROLE_SYSTEM"
+}
+
 @dataclass
 class LLMConfig:
     """Configuration for LLM calls"""
@@ -21,6 +31,11 @@ class LLMConfig:
 class LLMClient:
     """Client for making LLM API calls"""
 
+    # Maximum number of cached template completions
+    RESPONSE_CACHE_SIZE = 256
+    # Completions are only cached when sampling is close to deterministic
+    RESPONSE_CACHE_MAX_TEMPERATURE = 0.3
+
     def __init__(self, config: Optional[LLMConfig] = None):
         """Initialize LLM client with optional config"""
         self.config = config or LLMConfig()
@@ -33,14 +48,54 @@ class LLMClient:
         # Import PromptManager here to avoid circular imports
         from .prompt_manager import PromptManager
         self.prompt_manager = PromptManager()
+        
+        # Request serving ID for the default model, reused by every call that doesn't override it
+        self._serving_id = self._build_serving_id(self.config.model)
+        
+        # Template completions for repeated prompts, keyed by templates, contexts and config
+        self._response_cache: OrderedDict = OrderedDict()
+        
+        # HTTP session reused across calls so connections are kept alive
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the HTTP session for the running event loop, creating it if needed"""
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=64, keepalive_timeout=300, ttl_dns_cache=300),
+                headers={
+                    "Authorization": f"Basic {self.api_key}",
+                    "Content-Type": "application/json"
+                },
+                timeout=aiohttp.ClientTimeout(total=60)
+            )
+            self._session_loop = loop
+        return self._session
+
+    async def aclose(self) -> None:
+        """Close the HTTP session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._session_loop = None
+
+    @staticmethod
+    def _build_serving_id(model: str) -> Dict[str, Any]:
+        """Build the Inworld serving ID for a model"""
+        return {
+            "user_id": "user-test",
+            "model_id": {
+                "model": model,
+                "service_provider": "SERVICE_PROVIDER_OPENAI"
+            }
+        }
 
     def _convert_messages(self, messages: List[Dict[str, str]]) -> List[Dict[str, str]]:
         """Convert OpenAI message format to Inworld format"""
         return [
-            {
-                "role": "MESSAGE_ROLE_USER" if msg["role"] == "user" else "MESSAGE_ROLE_SYSTEM",
-                "content": msg["content"]
-            }
+            {"role": _ROLE_MAP.get(msg["role"], "MESSAGE_ROLE_SYSTEM"), "content": msg["content"]}
             for msg in messages
         ]
 
@@ -63,14 +118,12 @@ class LLMClient:
 
         try:
             # Prepare the request payload
+            serving_id = (
+                self._serving_id if cfg.model == self._serving_id["model_id"]["model"]
+                else self._build_serving_id(cfg.model)
+            )
             payload = {
-                "serving_id": {
-                    "user_id": "user-test",
-                    "model_id": {
-                        "model": cfg.model,
-                        "service_provider": "SERVICE_PROVIDER_OPENAI"
-                    }
-                },
+                "serving_id": serving_id,
                 "messages": self._convert_messages(messages),
                 "text_generation_config": {
                     "max_tokens": cfg.max_tokens,
@@ -83,45 +136,39 @@ class LLMClient:
                 payload["response_format"] = "RESPONSE_FORMAT_JSON"
                 logger.info("Requesting JSON response format")
 
-            logger.info(f"Sending request to Inworld API with payload: {payload}")
+            logger.debug("Sending request to Inworld API with payload: %s", payload)
 
-            # Make the API request
-            async with aiohttp.ClientSession() as session:
-                headers = {
-                    "Authorization": f"Basic {self.api_key}",
-                    "Content-Type": "application/json"
-                }
+            # Make the API request on the shared session
+            session = self._get_session()
+            async with session.post(self.base_url, data=orjson.dumps(payload)) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    logger.error(f"Inworld API error response: {error_text}")
+                    raise Exception(f"Inworld API error: {error_text}")
+                
+                result = orjson.loads(await response.read())
+                logger.debug("Raw Inworld API response: %s", result)
                 
-                async with session.post(self.base_url, json=payload, headers=headers) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        logger.error(f"Inworld API error response: {error_text}")
-                        raise Exception(f"Inworld API error: {error_text}")
-                    
-                    result = await response.json()
-                    logger.info(f"Raw Inworld API response: {result}")
-                    
-                    # Extract response text from the nested structure
+                # Extract response text from the nested structure
+                try:
+                    response_text = result["result"]["choices"][0]["message"]["content"]
+                    logger.info("Extracted response text: %s", response_text)
+                except (KeyError, IndexError) as e:
+                    logger.error(f"Failed to extract response text from structure: {result}")
+                    logger.error(f"Error details: {str(e)}")
+                    raise Exception("Failed to extract response text from Inworld API response")
+                
+                # If JSON format was requested, try to parse the response
+                if cfg.response_format:
                     try:
-                        response_text = result["result"]["choices"][0]["message"]["content"]
-                        logger.info(f"Extracted response text: {response_text}")
-                    except (KeyError, IndexError) as e:
-                        logger.error(f"Failed to extract response text from structure: {result}")
-                        logger.error(f"Error details: {str(e)}")
-                        raise Exception("Failed to extract response text from Inworld API response")
-                    
-                    # If JSON format was requested, try to parse the response
-                    if cfg.response_format:
-                        try:
-                            import json
-                            json.loads(response_text)
-                            logger.info("Successfully validated response as JSON")
-                        except json.JSONDecodeError as e:
-                            logger.error(f"Response is not valid JSON: {response_text}")
-                            logger.error(f"JSON parse error: {str(e)}")
-                            raise
-                    
-                    return response_text
+                        orjson.loads(response_text)
+                        logger.info("Successfully validated response as JSON")
+                    except orjson.JSONDecodeError as e:
+                        logger.error(f"Response is not valid JSON: {response_text}")
+                        logger.error(f"JSON parse error: {str(e)}")
+                        raise
+                
+                return response_text
 
         except Exception as e:
             logger.error(f"Error in chat_completion: {str(e)}", exc_info=True)
@@ -172,6 +219,147 @@ class LLMClient:
         Returns:
             Generated response text
         """
+        cfg = config or self.config
+        cache_key = self._response_cache_key(user_template, user_context, system_template, system_context, cfg)
+        if cache_key is not None:
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                self._response_cache.move_to_end(cache_key)
+                logger.info(f"Using cached response for template {user_template}")
+                return cached
+        
+        messages = self.render_template_messages(user_template, user_context, system_template, system_context)
+        response_text = await self.chat_completion(messages, config)
+        
+        if cache_key is not None:
+            self._response_cache[cache_key] = response_text
+            if len(self._response_cache) > self.RESPONSE_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
+        return response_text
+    
+    async def chat_with_template_parts(
+        self,
+        user_template: str,
+        user_context: Dict[str, any],
+        parts: List[str],
+        system_template: Optional[str] = None,
+        system_context: Optional[Dict[str, any]] = None,
+        config: Optional[LLMConfig] = None
+    ) -> Dict[str, str]:
+        """
+        Generate several named pieces of text for the same prompt in one request
+        
+        The system prompt is wrapped in the multi_reaction.j2 template, which asks
+        for a JSON object with one key per part. If the reply can't be used, each
+        part is requested separately, with an instruction naming the part added
+        to the user prompt.
+        
+        Args:
+            user_template: Name of the user prompt template file
+            user_context: Context variables for the user template
+            parts: Names of the pieces of text to generate
+            system_template: Optional name of the system prompt template file
+            system_context: Optional context variables for the system template
+            config: Optional config override
+            
+        Returns:
+            Dict mapping each part name to its generated text
+        """
+        cfg = config or self.config
+        
+        instructions = None
+        if system_template:
+            instructions = self.prompt_manager.render_template(system_template, **(system_context or {}))
+        messages = [
+            {
+                "role": "system",
+                "content": self.prompt_manager.render_template(
+                    "multi_reaction.j2", parts=parts, instructions=instructions
+                )
+            },
+            {
+                "role": "user",
+                "content": self.prompt_manager.render_template(user_template, **user_context)
+            }
+        ]
+        
+        try:
+            response_text = await self.chat_completion(
+                messages, replace(cfg, response_format={"type": "json_object"})
+            )
+            result = orjson.loads(response_text)
+            if isinstance(result, dict) and all(isinstance(result.get(part), str) for part in parts):
+                return {part: result[part] for part in parts}
+            logger.warning(f"Multi-part response is missing parts: {response_text}")
+        except Exception as e:
+            logger.warning(f"Multi-part completion failed, requesting parts separately: {e}")
+        
+        # Fall back to one request per part, each prompt naming the part it asks for
+        base_messages = self.render_template_messages(user_template, user_context, system_template, system_context)
+        
+        async def request_part(part: str) -> str:
+            messages = base_messages[:-1] + [{
+                "role": "user",
+                "content": f"{base_messages[-1]['content']}\n\nRespond only with the {part} text."
+            }]
+            return await self.chat_completion(messages, config)
+        
+        responses = await asyncio.gather(*(request_part(part) for part in parts))
+        return dict(zip(parts, responses))
+    
+    def _response_cache_key(
+        self,
+        user_template: str,
+        user_context: Dict[str, any],
+        system_template: Optional[str],
+        system_context: Optional[Dict[str, any]],
+        cfg: LLMConfig
+    ) -> Optional[Tuple]:
+        """
+        Build the response cache key for a template completion
+        
+        Returns:
+            The cache key, or None if the completion shouldn't be cached (sampling
+            temperatures above the threshold, or contexts containing unhashable values)
+        """
+        if cfg.temperature > self.RESPONSE_CACHE_MAX_TEMPERATURE:
+            return None
+        
+        try:
+            cache_key = (
+                user_template,
+                frozenset(user_context.items()),
+                system_template,
+                frozenset((system_context or {}).items()),
+                cfg.model,
+                cfg.temperature,
+                cfg.max_tokens,
+                bool(cfg.response_format)
+            )
+            hash(cache_key)
+        except TypeError:
+            return None
+        return cache_key
+    
+    def render_template_messages(
+        self,
+        user_template: str,
+        user_context: Dict[str, any],
+        system_template: Optional[str] = None,
+        system_context: Optional[Dict[str, any]] = None
+    ) -> List[Dict[str, str]]:
+        """
+        Render Jinja2 templates into chat messages
+        
+        Args:
+            user_template: Name of the user prompt template file
+            user_context: Context variables for the user template
+            system_template: Optional name of the system prompt template file
+            system_context: Optional context variables for the system template
+            
+        Returns:
+            List of message dicts with role and content
+        """
         messages = []
         
         # Add system message if template is provided
@@ -189,4 +377,20 @@ class LLMClient:
         )
         messages.append({"role": "user", "content": user_prompt})
         
-        return await self.chat_completion(messages, config)
+        return messages
+
+
+# Shared client instance, created on first use
+_SHARED_LLM_CLIENT: Optional[LLMClient] = None
+
+def get_shared_llm_client() -> LLMClient:
+    """Get the LLM client shared by the AI players and host, creating it on first use"""
+    global _SHARED_LLM_CLIENT
+    if _SHARED_LLM_CLIENT is None:
+        _SHARED_LLM_CLIENT = LLMClient()
+    return _SHARED_LLM_CLIENT
+
+async def close_shared_llm_client() -> None:
+    """Close the shared LLM client's HTTP session, if the client was ever created"""
+    if _SHARED_LLM_CLIENT is not None:
+        await _SHARED_LLM_CLIENT.aclose()
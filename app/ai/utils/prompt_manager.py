@@ -1,7 +1,8 @@
 import os
 import logging
+from collections import OrderedDict
 from typing import Dict, Any, Optional
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache, Template
 
 logger = logging.getLogger(__name__)
 
@@ -10,6 +11,9 @@ class PromptManager:
     Manages loading and rendering of prompt templates using Jinja2.
     """
     
+    # Maximum number of rendered outputs kept for hashable contexts
+    RENDER_CACHE_SIZE = 256
+    
     def __init__(self, templates_dir: Optional[str] = None):
         """
         Initialize the prompt manager with a templates directory.
@@ -31,13 +35,48 @@ class PromptManager:
         self.templates_dir = templates_dir
         logger.info(f"Initializing PromptManager with templates directory: {templates_dir}")
         
-        # Initialize Jinja2 environment
+        # Initialize Jinja2 environment. Templates don't change at runtime, so
+        # skip the per-lookup mtime check and never evict compiled templates.
+        # Compiled bytecode is cached on disk so new processes skip compilation,
+        # and the templates are plain-text LLM prompts, so nothing is escaped.
         self.env = Environment(
             loader=FileSystemLoader(templates_dir),
-            autoescape=select_autoescape(['html', 'xml']),
+            autoescape=False,
             trim_blocks=True,
-            lstrip_blocks=True
+            lstrip_blocks=True,
+            auto_reload=False,
+            cache_size=-1,
+            bytecode_cache=FileSystemBytecodeCache()
         )
+        
+        # Compiled templates by name
+        self._templates: Dict[str, Template] = {}
+        
+        # Rendered output for contexts made only of hashable values
+        self._rendered: OrderedDict = OrderedDict()
+        
+        # Compile every existing template up front
+        for template_name in self.env.list_templates(extensions=['j2']):
+            try:
+                self.get_template(template_name)
+            except Exception as e:
+                logger.warning(f"Failed to precompile template {template_name}: {e}")
+    
+    def get_template(self, template_name: str) -> Template:
+        """
+        Get a compiled template, loading and compiling it on first use.
+        
+        Args:
+            template_name: Name of the template file (with .j2 extension)
+            
+        Returns:
+            The compiled Jinja2 template
+        """
+        template = self._templates.get(template_name)
+        if template is None:
+            template = self.env.get_template(template_name)
+            self._templates[template_name] = template
+        return template
     
     def render_template(self, template_name: str, **kwargs) -> str:
         """
@@ -51,8 +90,27 @@ class PromptManager:
             Rendered template as a string
         """
         try:
-            template = self.env.get_template(template_name)
-            return template.render(**kwargs)
+            # Reuse the output of an identical render when the context is hashable
+            try:
+                cache_key = (template_name, frozenset(kwargs.items()))
+                hash(cache_key)
+            except TypeError:
+                cache_key = None
+            
+            if cache_key is not None:
+                rendered = self._rendered.get(cache_key)
+                if rendered is not None:
+                    self._rendered.move_to_end(cache_key)
+                    return rendered
+            
+            template = self.get_template(template_name)
+            rendered = template.render(**kwargs)
+            
+            if cache_key is not None:
+                self._rendered[cache_key] = rendered
+                if len(self._rendered) > self.RENDER_CACHE_SIZE:
+                    self._rendered.popitem(last=False)
+            return rendered
         except Exception as e:
             logger.error(f"Error rendering template {template_name}: {e}")
             # Return a simple fallback to avoid breaking the application
@@ -3,17 +3,118 @@ Text-to-Speech client using Inworld's TTS API.
 This module provides a class for generating speech from text.
 """
 
-import requests
-import json
+import asyncio
 import base64
+import binascii
+import hashlib
 import os
+import shutil
+import tempfile
+import uuid
 import logging
 from pathlib import Path
+import aiohttp
+import orjson
 
 # Set up logging
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+def _write_file(path, data):
+    """Write bytes to a file (run in a worker thread from async code)."""
+    with open(path, 'wb') as f:
+        f.write(data)
+
+def _link_or_copy(src, dst):
+    """
+    Hard-link src to dst, replacing dst atomically, or copy it where the two
+    can't be linked (e.g. they are on different filesystems).
+    """
+    temp_path = f"{dst}.{uuid.uuid4().hex}.tmp"
+    try:
+        os.link(src, temp_path)
+    except OSError:
+        shutil.copyfile(src, temp_path)
+    os.replace(temp_path, dst)
+
+def _store_cached_audio(audio_file, cache_path, max_files):
+    """
+    Add a generated audio file to the TTS cache, then evict the least recently
+    used entries (by modification time) beyond max_files.
+    """
+    cache_dir = os.path.dirname(cache_path)
+    os.makedirs(cache_dir, exist_ok=True)
+    _link_or_copy(audio_file, cache_path)
+    entries = []
+    with os.scandir(cache_dir) as it:
+        for entry in it:
+            if entry.is_file() and entry.name.endswith(".wav") and ".prefetch" not in entry.name:
+                entries.append((entry.stat().st_mtime, entry.path))
+    entries.sort()
+    for _, path in entries[:max(len(entries) - max_files, 0)]:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+def _load_cached_audio(cache_path, output_file):
+    """Link or copy a cached audio file to output_file, marking the entry as recently used."""
+    os.utime(cache_path)
+    _link_or_copy(cache_path, output_file)
+
+class _AudioContentStream:
+    """
+    Incrementally extracts and decodes the base64 "audioContent" value from a
+    TTS response body as it is streamed in.
+    """
+    
+    MARKER = b'"audioContent":"'
+    
+    def __init__(self):
+        # Body received before the audio content was found (the whole body if it never is)
+        self.buffer = bytearray()
+        self.found = False
+        self.done = False
+        # Trailing base64 characters that don't yet form a complete 4-character group
+        self._pending = b""
+    
+    def feed(self, chunk):
+        """
+        Feed the next chunk of the response body.
+        
+        Args:
+            chunk (bytes): The next chunk of the response body.
+        
+        Returns:
+            bytes: The audio bytes decoded from this chunk (possibly empty).
+        """
+        if self.done:
+            return b""
+        
+        if not self.found:
+            self.buffer += chunk
+            pos = self.buffer.find(self.MARKER)
+            if pos < 0:
+                return b""
+            self.found = True
+            chunk = bytes(self.buffer[pos + len(self.MARKER):])
+            self.buffer = bytearray()
+        
+        end = chunk.find(b'"')
+        if end >= 0:
+            chunk = chunk[:end]
+            self.done = True
+        
+        # Drop JSON escape backslashes (e.g. "\/"), then decode whole 4-character groups
+        data = self._pending + chunk.replace(b"\\", b"")
+        if self.done:
+            self._pending = b""
+            return binascii.a2b_base64(data) if data else b""
+        
+        cut = len(data) - len(data) % 4
+        self._pending = data[cut:]
+        return binascii.a2b_base64(data[:cut]) if cut else b""
+
 class TTSClient:
     """
     Client for Inworld's speech-to-text service.
@@ -21,13 +122,18 @@ class TTSClient:
     This class provides methods to convert text to speech using Inworld's TTS API.
     """
     
-    def __init__(self, api_key=None):
+    # Maximum number of audio files kept in the on-disk speech cache
+    MAX_CACHE_FILES = 200
+    
+    def __init__(self, api_key=None, cache_dir=None):
         """
         Initialize the TTS client.
         
         Args:
             api_key (str, optional): The Inworld API key. If not provided, it will
                                      attempt to load from INWORLD_API_KEY environment variable.
+            cache_dir (str, optional): Directory for cached speech audio. Defaults to
+                                       'jeopardy_tts_cache' in the system temp directory.
         
         Raises:
             ValueError: If API key is not provided and not found in environment variables.
@@ -53,9 +159,43 @@ class TTSClient:
             'Authorization': auth_value,
             'Content-Type': 'application/json'
         }
+        
+        # Generated audio is cached on disk by text and voice, since host lines repeat
+        self.cache_dir = cache_dir or os.path.join(tempfile.gettempdir(), "jeopardy_tts_cache")
+        
+        # Prefetch tasks generating audio into the cache, keyed by cache path
+        self._inflight = {}
+        
+        # HTTP session reused across calls so connections are kept alive
+        self._session = None
+        self._session_loop = None
         logger.info(f"Initialized TTSClient with API URL: {self.url}")
     
-    def generate_speech(self, text, voice_name="Timothy", output_file=None):
+    def _get_session(self):
+        """Get the HTTP session for the running event loop, creating it if needed."""
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=8, keepalive_timeout=75),
+                headers=self.headers,
+                timeout=aiohttp.ClientTimeout(total=30)
+            )
+            self._session_loop = loop
+        return self._session
+    
+    async def aclose(self):
+        """Close the HTTP session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._session_loop = None
+    
+    def _cache_path(self, text, voice_name):
+        """Get the cache file path for a text and voice."""
+        digest = hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}_{voice_name}.wav")
+    
+    async def generate_speech(self, text, voice_name="Timothy", output_file=None):
         """
         Generate speech from text and save it to a WAV file.
         
@@ -86,22 +226,6 @@ class TTSClient:
         }
         
         try:
-            logger.info(f"Making API request to {self.url}")
-            
-            response = requests.post(
-                self.url,
-                headers=self.headers,
-                data=json.dumps(payload),
-                timeout=30
-            )
-            
-            logger.info(f"API response status code: {response.status_code}")
-            
-            # Check if the response is successful
-            if response.status_code != 200:
-                logger.error(f"API error: {response.status_code} - {response.text}")
-                raise Exception(f"API returned error: {response.status_code} - {response.text}")
-            
             # Create a file path if not provided
             if not output_file:
                 # Create a temporary file name with the first few words of the text
@@ -112,75 +236,134 @@ class TTSClient:
             output_path = Path(output_file)
             output_path.parent.mkdir(parents=True, exist_ok=True)
             
-            # Extract and process audio content
-            try:
-                # Try to extract the base64 audio content using string operations
-                # This is more robust than JSON parsing if the response is malformed
-                response_text = response.text
-                
-                # Look for the audioContent field
-                if '"audioContent":"' in response_text:
-                    logger.info("Found audioContent field in response")
-                    
-                    # Find the start and end of the base64 content
-                    start_marker = '"audioContent":"'
-                    start_pos = response_text.find(start_marker) + len(start_marker)
-                    end_pos = response_text.find('"', start_pos)
-                    
-                    if end_pos > start_pos:
-                        # Extract the base64 string
-                        audio_base64 = response_text[start_pos:end_pos]
-                        
-                        # Decode the base64 data
-                        audio_data = base64.b64decode(audio_base64)
-                        
-                        # Write to file
-                        with open(output_file, 'wb') as f:
-                            f.write(audio_data)
-                        
-                        logger.info(f"Successfully saved decoded audio to: {output_file}")
-                        return output_file
-                
-                # Fallback to using JSON parsing if the string approach didn't work
-                logger.info("Trying JSON parsing as fallback")
+            # Reuse previously generated audio for the same text and voice, waiting
+            # for a prefetch of it to finish first
+            cache_path = self._cache_path(text, voice_name)
+            inflight = self._inflight.get(cache_path)
+            if inflight is not None and inflight is not asyncio.current_task():
                 try:
-                    # Only parse the first JSON object if there are multiple
-                    json_str = response_text.split('\n')[0]
-                    data = json.loads(json_str)
-                    
-                    if 'result' in data and 'audioContent' in data['result']:
-                        audio_base64 = data['result']['audioContent']
-                        audio_data = base64.b64decode(audio_base64)
-                        
-                        with open(output_file, 'wb') as f:
-                            f.write(audio_data)
-                        
-                        logger.info(f"Successfully saved audio via JSON parsing to: {output_file}")
-                        return output_file
-                except json.JSONDecodeError:
-                    logger.warning("JSON parsing fallback also failed")
+                    await asyncio.shield(inflight)
+                except Exception:
+                    # The prefetch failed, so generate the audio here instead
+                    pass
+            if os.path.exists(cache_path):
+                await asyncio.to_thread(_load_cached_audio, cache_path, output_file)
+                logger.info(f"Using cached speech audio for: '{text[:50]}...'")
+                return output_file
+            
+            logger.info(f"Making API request to {self.url}")
+            session = self._get_session()
+            async with session.post(self.url, data=orjson.dumps(payload)) as response:
+                logger.info(f"API response status code: {response.status}")
                 
-                # Last resort: save raw response
-                logger.warning("Using raw response as last resort")
-                with open(output_file, 'wb') as f:
-                    f.write(response.content)
+                # Check if the response is successful
+                if response.status != 200:
+                    error_text = await response.text()
+                    logger.error(f"API error: {response.status} - {error_text}")
+                    raise Exception(f"API returned error: {response.status} - {error_text}")
                 
-                logger.info(f"Saved raw response to: {output_file}")
+                # Decode the base64 audio content as it arrives and write it straight to
+                # the file, so the full response and decoded audio are never held in memory
+                audio_stream = _AudioContentStream()
+                audio_file = None
+                try:
+                    async for chunk in response.content.iter_chunked(64 * 1024):
+                        audio_data = audio_stream.feed(chunk)
+                        if audio_data:
+                            if audio_file is None:
+                                audio_file = await asyncio.to_thread(open, output_file, 'wb', 1 << 20)
+                            await asyncio.to_thread(audio_file.write, audio_data)
+                finally:
+                    if audio_file is not None:
+                        await asyncio.to_thread(audio_file.close)
+            
+            if audio_stream.found:
+                logger.info(f"Successfully saved decoded audio to: {output_file}")
+                await self._cache_audio(output_file, cache_path)
                 return output_file
+            
+            # No audioContent field was found, so the whole (audio-free) body was kept
+            response_content = bytes(audio_stream.buffer)
+            
+            # Fallback to using JSON parsing in case the field is formatted differently
+            logger.info("Trying JSON parsing as fallback")
+            try:
+                # Only parse the first JSON object if there are multiple
+                json_str = response_content.split(b'\n')[0]
+                data = orjson.loads(json_str)
                 
-            except Exception as e:
-                logger.error(f"Error processing response: {e}")
-                # Save raw response as fallback
-                with open(output_file, 'wb') as f:
-                    f.write(response.content)
-                logger.info(f"Saved raw response after error: {output_file}")
-                return output_file
+                if 'result' in data and 'audioContent' in data['result']:
+                    audio_base64 = data['result']['audioContent']
+                    audio_data = base64.b64decode(audio_base64)
+                    
+                    await asyncio.to_thread(_write_file, output_file, audio_data)
+                    
+                    logger.info(f"Successfully saved audio via JSON parsing to: {output_file}")
+                    await self._cache_audio(output_file, cache_path)
+                    return output_file
+            except orjson.JSONDecodeError:
+                logger.warning("JSON parsing fallback also failed")
+            
+            # Last resort: save raw response
+            logger.warning("Using raw response as last resort")
+            await asyncio.to_thread(_write_file, output_file, response_content)
+            
+            logger.info(f"Saved raw response to: {output_file}")
+            return output_file
             
-        except requests.exceptions.RequestException as e:
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             logger.error(f"HTTP request error: {str(e)}")
             raise Exception(f"Failed to make API request: {str(e)}")
         except Exception as e:
             logger.error(f"Error generating speech: {str(e)}")
             import traceback
             logger.error(traceback.format_exc())
-            raise Exception(f"Failed to generate speech: {str(e)}") 
\ No newline at end of file
+            raise Exception(f"Failed to generate speech: {str(e)}")
+    
+    async def _cache_audio(self, audio_file, cache_path):
+        """
+        Add generated audio to the cache, logging rather than failing on errors.
+        
+        Args:
+            audio_file (str): Path to the generated WAV file.
+            cache_path (str): Cache file path for the text and voice.
+        """
+        try:
+            await asyncio.to_thread(_store_cached_audio, audio_file, cache_path, self.MAX_CACHE_FILES)
+        except OSError as e:
+            logger.warning(f"Failed to cache speech audio: {e}")
+    
+    def prefetch(self, text, voice_name="Timothy"):
+        """
+        Start generating speech into the cache in the background, so a later
+        generate_speech call for the same text and voice is served from it.
+        
+        Args:
+            text (str): The text to convert to speech.
+            voice_name (str, optional): The name of the voice to use. Defaults to "Timothy".
+        
+        Returns:
+            asyncio.Task: The prefetch task, or None if the audio is already cached.
+        """
+        cache_path = self._cache_path(text, voice_name)
+        task = self._inflight.get(cache_path)
+        if task is not None:
+            return task
+        if os.path.exists(cache_path):
+            return None
+        
+        task = asyncio.create_task(self._prefetch(text, voice_name, cache_path))
+        self._inflight[cache_path] = task
+        task.add_done_callback(lambda _: self._inflight.pop(cache_path, None))
+        return task
+    
+    async def _prefetch(self, text, voice_name, cache_path):
+        """Generate speech to a scratch file (which also fills the cache), then remove it."""
+        scratch_file = f"{cache_path}.{uuid.uuid4().hex}.prefetch.wav"
+        try:
+            await self.generate_speech(text, voice_name=voice_name, output_file=scratch_file)
+        except Exception as e:
+            logger.warning(f"Speech prefetch failed: {e}")
+        finally:
+            if os.path.exists(scratch_file):
+                os.remove(scratch_file)
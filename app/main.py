@@ -365,6 +365,12 @@ async def startup_event():
     await game_service.startup()
     logger.info("Application startup completed")
 
+# Shutdown event
+@app.on_event("shutdown")
+async def shutdown_event():
+    # Close the AI host's HTTP sessions before the event loop stops
+    await game_service.shutdown()
+
 # Mount frontend static assets AFTER all API and WebSocket routes are defined
 app.mount("/assets", StaticFiles(directory="frontend/dist/assets"), name="assets")
 
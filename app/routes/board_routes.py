@@ -6,6 +6,9 @@ import requests
 
 logger = logging.getLogger(__name__)
 
+# Background tasks started by routes, kept referenced until they finish
+_background_tasks = set()
+
 router = APIRouter(
     prefix="/api/board",
     tags=["board"],
@@ -60,6 +63,41 @@ async def reveal_category(request: Request, data: Dict[str, Any]):
     
     return {"status": "success", "message": f"Category {index} revealed"}
 
+@router.post("/reveal-categories")
+async def reveal_categories(request: Request, data: Dict[str, Any]):
+    """Reveal several generated categories on the board, one at a time."""
+    
+    categories = data.get("categories")
+    interval = data.get("interval", 1.5)
+    
+    if not categories:
+        raise HTTPException(status_code=400, detail="Categories are required")
+    
+    logger.info(f"Revealing {len(categories)} categories via API")
+    
+    # Access the game service from app state
+    game_service = request.app.state.game_service
+    
+    async def reveal_all():
+        # Pace the reveals on the server so the caller only makes one request
+        for index, category in enumerate(categories):
+            if index:
+                await asyncio.sleep(interval)
+            await game_service.connection_manager.broadcast_message(
+                "com.sc2ctl.jeopardy.reveal_category",
+                {
+                    "index": index,
+                    "category": category
+                }
+            )
+    
+    # Keep a reference so the task isn't garbage collected before it finishes
+    task = asyncio.create_task(reveal_all())
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    
+    return {"status": "success", "message": f"Revealing {len(categories)} categories"}
+
 @router.post("/select-question")
 async def select_question(request: Request, data: Dict[str, Any]):
     """
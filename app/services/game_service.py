@@ -9,7 +9,7 @@ from ..models.finaljeopardy import FinalJeopardyQuestionResponse
 from ..websockets.connection_manager import ConnectionManager
 import logging
 from ..models.game_state import GameStateManager
-from ..ai.llm_state_manager import LLMStateManager
+from ..ai.llm_state_manager import get_llm_state_manager
 from ..ai.host import AIHostService
 from ..ai.host.buzzer_manager import BuzzerManager
 import json
@@ -47,7 +47,7 @@ class GameService:
         self.board = None
         self.boards_path = Path("app/game_data")
         self.state = GameStateManager()
-        self.llm_state = LLMStateManager()  # Initialize LLM state manager
+        self.llm_state = get_llm_state_manager()  # Shared LLM state manager
         self.current_question = None
         self.buzzer_active = False
         self.last_buzzer = None
@@ -200,6 +200,7 @@ class GameService:
                 "answer": question["answer"],
                 "daily_double": is_daily_double
             }
+            self.notify_ai_host()
             
             # Handle daily double differently
             if is_daily_double:
@@ -235,6 +236,11 @@ class GameService:
         except Exception as e:
             logger.error(f"Error displaying question: {e}")
     
+    def notify_ai_host(self):
+        """Wake the AI host's game loop after question, buzzer or player state changes"""
+        if self.ai_host:
+            self.ai_host.notify_state_change()
+    
     async def dismiss_question(self):
         """Dismiss the current question and broadcast to all clients"""
         logger.info("Dismissing question")
@@ -255,6 +261,7 @@ class GameService:
         # Clear question state
         self.current_question = None
         self.last_buzzer = None
+        self.notify_ai_host()
     
     async def change_buzzer_status(self, active: bool):
         """Change buzzer status and broadcast to all clients"""
@@ -265,6 +272,7 @@ class GameService:
             await self.buzzer_manager.activate_buzzer()
         else:
             await self.buzzer_manager.deactivate_buzzer()
+        self.notify_ai_host()
     
     async def register_player(self, websocket: WebSocket, name: str, preferences: str = ''):
         """Register a new player with the given name and preferences"""
@@ -278,6 +286,8 @@ class GameService:
                 if hasattr(self, 'ai_host') and self.ai_host and hasattr(self.ai_host, 'game_state_manager'):
                     self.ai_host.game_state_manager.add_player_preference(name, preferences)
                     
+            self.notify_ai_host()
+            
             # Broadcast updated player list
             await self.broadcast_player_list()
             
@@ -321,6 +331,7 @@ class GameService:
         
         # Use the buzzer manager to handle the buzz event
         await self.buzzer_manager.handle_player_buzz(contestant.name)
+        self.notify_ai_host()
         
         # Notify all clients of the buzz
         await self.connection_manager.broadcast_message(
@@ -375,6 +386,7 @@ class GameService:
             
             # Use the buzzer manager to handle the correct answer
             await self.buzzer_manager.handle_correct_answer(contestant_name)
+            self.notify_ai_host()
             
             # If this was a daily double or all questions have been answered, we're done
             if daily_double or self.all_questions_answered():
@@ -404,6 +416,7 @@ class GameService:
             
             # Use the buzzer manager to handle incorrect answer
             await self.buzzer_manager.handle_incorrect_answer(contestant_name)
+            self.notify_ai_host()
             
             # Broadcast score update
             await self.send_contestant_scores()
@@ -454,6 +467,7 @@ class GameService:
         # For daily doubles, the contestant who selected it automatically gets to answer
         # So we don't activate the buzzer for everyone
         self.last_buzzer = contestant
+        self.notify_ai_host()
         
         # Update LLM state
         self.llm_state.question_displayed(
@@ -683,6 +697,11 @@ class GameService:
         # Return success
         return True
 
+    async def shutdown(self):
+        """Shut down the AI host and close its HTTP sessions"""
+        logger.info("Shutting down game service")
+        await self.ai_host.aclose()
+
     async def handle_chat_message(self, username: str, message: str):
         """
         Handle a chat message from a player and forward it to the AI host.
@@ -38,18 +38,19 @@ class ConnectionManager:
 
     async def broadcast_message(self, topic: str, payload: dict):
         """Broadcast a message to all connected clients"""
-        message = {"topic": topic, "payload": payload}
+        # Serialize once (matching send_json's encoding) instead of once per client
+        message_json = json.dumps({"topic": topic, "payload": payload}, separators=(",", ":"), ensure_ascii=False)
         disconnected = []
         
-        for client_id, connection in self.active_connections.items():
+        for client_id, connection in list(self.active_connections.items()):
             try:
-                await connection.send_json(message)
+                await connection.send_text(message_json)
             except:
                 disconnected.append(client_id)
                 
         # Clean up disconnected clients
         for client_id in disconnected:
-            self.disconnect(connection)
+            self.active_connections.pop(client_id, None)
 
     async def broadcast_to_topic(self, topic: str, message: dict):
         if topic not in self.topic_subscriptions:
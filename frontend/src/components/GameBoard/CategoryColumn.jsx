@@ -1,9 +1,12 @@
 import React from 'react';
 import QuestionCell from './QuestionCell';
 
-export default function CategoryColumn({ category, isAdmin, isPlaceholder, isRevealing }) {
+export default function CategoryColumn({ category, categoryIndex, isAdmin, isPlaceholder, isRevealing }) {
   return (
-    <div className={`category ${isPlaceholder ? 'placeholder' : ''} ${isRevealing ? 'revealing' : ''}`}>
+    <div
+      className={`category ${isPlaceholder ? 'placeholder' : ''} ${isRevealing ? 'revealing' : ''}`}
+      data-cat-idx={categoryIndex}
+    >
       <div className="category-title">{category.name}</div>
       {category.questions.map((question, index) => (
         <QuestionCell
@@ -13,6 +16,8 @@ export default function CategoryColumn({ category, isAdmin, isPlaceholder, isRev
             used: question.used || false // ensure used property exists
           }}
           categoryName={category.name}
+          categoryIndex={categoryIndex}
+          valueIndex={index}
           isAdmin={isAdmin}
           isPlaceholder={isPlaceholder || question.isPlaceholder}
         />
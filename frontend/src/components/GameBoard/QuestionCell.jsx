@@ -1,7 +1,7 @@
 import React from 'react';
 import { useGame } from '../../contexts/GameContext';
 
-export default function QuestionCell({ question, categoryName, isAdmin, isPlaceholder }) {
+export default function QuestionCell({ question, categoryName, categoryIndex, valueIndex, isAdmin, isPlaceholder }) {
   const { sendMessage } = useGame();
 
   const handleClick = () => {
@@ -24,6 +24,8 @@ export default function QuestionCell({ question, categoryName, isAdmin, isPlaceh
   return (
     <div 
       className={`question ${question.used ? 'used' : ''} ${isPlaceholder ? 'placeholder' : ''}`}
+      data-cat-idx={categoryIndex}
+      data-val-idx={valueIndex}
       onClick={handleClick}
     >
       ${question.value}
@@ -22,6 +22,7 @@ export default function GameBoard() {
         <CategoryColumn 
           key={index}
           category={category}
+          categoryIndex={index}
           isAdmin={state.adminMode}
           isPlaceholder={state.boardGenerating && !state.revealedCategories.has(index)}
           isRevealing={state.boardGenerating && state.revealedCategories.has(index)}